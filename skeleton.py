@@ -1,123 +1,509 @@
 from dataclasses import dataclass
 from typing import List, Dict, Union, Literal, Any, Tuple
 from PIL import Image
+from array import array
 import os
+import sys
+import io
+import mmap
 import json
+import hashlib
 from math import inf as infinity
 import pickle
+import re
+import struct
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+import multiprocessing
+import numpy as np
 
-@dataclass
+try:
+    from numba import njit
+except ImportError:  # numba 미설치 환경에서는 순수 파이썬 루프로 동작
+    njit = None
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 환경에서는 표준 json 사용
+    orjson = None
+
+try:
+    import pyvips
+except ImportError:  # pyvips 미설치 환경에서는 PIL 로 디코딩
+    pyvips = None
+
+# 배열 페이로드 종류 태그 (각 배열 데이터의 첫 바이트)
+ARRAY_KIND_PICKLE = 0
+ARRAY_KIND_NDARRAY = 1
+ARRAY_KIND_STACK = 2  # 같은 크기의 배열 N개를 하나로 쌓은 (N, ...) ndarray
+
+# 헤더 메타데이터 형식 태그
+METADATA_FORMAT_JSON = 1
+
+# 루프 정보 고정 레이아웃: loop (int64, 무한 반복은 -1), loopDelay (int32)
+LOOP_STRUCT = struct.Struct('<qi')
+
+# 텍스트 action 1바이트 코드
+ACTION_CODES = {'left': 0, 'right': 1, 'up': 2, 'down': 3, 'stay': 4}
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.gif')
+
+# writev 한 번에 넘길 수 있는 최대 버퍼 수
+IOV_MAX = 1024
+
+# 이 크기 이상의 BIN 파일은 mmap 으로 기록 (작은 파일은 writev 가 더 빠름)
+MMAP_WRITE_THRESHOLD = 1 << 20
+
+def _as_int32_array(values: Any) -> array:
+    """정수 시퀀스를 int32 array 로 변환 (이미 int32 array 면 그대로, None 은 빈 array)"""
+    if isinstance(values, array) and values.typecode == 'i':
+        return values
+    return array('i', values if values is not None else ())
+
+@dataclass(slots=True, frozen=True)
 class PixelArtInput:
-    image_arrays: List[Any]  # 이미지 배열 데이터
+    image_arrays: Union[np.ndarray, List[Any]]  # 이미지 배열 데이터 ((N, H, W, 3) 또는 팔레트 인덱스 (N, H, W) ndarray, 리스트)
     cluster: Dict[int, List[int]]
     loop: Union[int, float] = infinity
     loopDelay: int = 0
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TextInput:
-    text_arrays: List[Any]  # 텍스트 이미지 배열 데이터
-    loop: Union[int, float] = infinity
-    duration: List[int]
+    text_arrays: Union[np.ndarray, List[Any]]  # 텍스트 이미지 배열 데이터
+    duration: Union[array, List[int]]  # 리스트로 넘겨도 int32 array 로 변환
     action: List[Literal['left', 'right', 'up', 'down', 'stay']]
+    loop: Union[int, float] = infinity
     loopDelay: int = 0
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'duration', _as_int32_array(self.duration))
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MixedInput:
-    image_arrays: List[Any]  # 이미지 배열 데이터
+    image_arrays: Union[np.ndarray, List[Any]]  # 이미지 배열 데이터
     cluster: Dict[int, List[int]]
     loop: Union[int, float] = infinity
     loopDelay: int = 0
-    text_arrays: List[Any] = None  # 텍스트 이미지 배열 데이터
-    duration: List[int] = None
+    text_arrays: Union[np.ndarray, List[Any]] = None  # 텍스트 이미지 배열 데이터
+    duration: Union[array, List[int]] = None  # 리스트로 넘겨도 int32 array 로 변환
     action: List[Literal['left', 'right', 'up', 'down', 'stay']] = None
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'duration', _as_int32_array(self.duration))
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TotalFunctionInput:
     mode: Literal['pixelart', 'text', 'mixed']
     directory: str
 
-def pixel_image_to_array(image: Image.Image, bin_path: str):
-    """이미지 변환 처리"""
-    # 가짜 함수, 실제 구현 필요
-    return "이미지 배열 데이터"
+def _convert_pixels(img_u8: np.ndarray, out: np.ndarray, palette: np.ndarray) -> None:
+    """각 픽셀을 가장 가까운 팔레트 색상의 인덱스로 변환 (out 에 기록)"""
+    height, width = out.shape
+    for y in range(height):
+        for x in range(width):
+            best_index = 0
+            best_dist = 1 << 30
+            for k in range(palette.shape[0]):
+                dist = 0
+                for c in range(3):
+                    d = int(img_u8[y, x, c]) - int(palette[k, c])
+                    dist += d * d
+                if dist < best_dist:
+                    best_dist = dist
+                    best_index = k
+            out[y, x] = best_index
 
-def load_images_and_convert(image_paths: List[str], bin_path: str) -> List[Any]:
-    """이미지 파일들을 로드하고 배열로 변환"""
-    images = [Image.open(path) for path in image_paths]
-    return [pixel_image_to_array(img, bin_path) for img in images]
+# numba 가 없을 때 브로드캐스트 + argmin 으로 처리할 한 블록의 최대 (픽셀 x 팔레트) 원소 수 (L2 캐시 크기 기준)
+PALETTE_BLOCK_ELEMENTS = 1 << 16
 
-def load_config(config_path: str) -> Dict:
-    """설정 파일 로드"""
-    if not os.path.exists(config_path):
-        return {}
+def _convert_pixels_numpy(img_u8: np.ndarray, out: np.ndarray, palette: np.ndarray) -> None:
+    """_convert_pixels 의 NumPy 버전 (픽셀/팔레트 축을 블록으로 나눠 벡터화된 거리 계산)"""
+    pixels = img_u8.reshape(-1, 3).astype(np.int32)  # 부호 있는 정수로 언더플로 방지
+    pal = palette.astype(np.int32)
+    flat_out = out.reshape(-1)
+    block = max(1, PALETTE_BLOCK_ELEMENTS // max(1, pal.shape[0]))
+    for start in range(0, pixels.shape[0], block):
+        diff = pixels[start:start + block, None, :] - pal[None, :, :]
+        dists = np.einsum('pkc,pkc->pk', diff, diff)
+        flat_out[start:start + block] = dists.argmin(-1)
+
+if njit is not None:
+    # 이미지 단위로 스레드 풀에서 호출되므로 parallel 대신 nogil 로 스레드끼리 병렬 실행
+    # (워커 스레드에서 parallel 커널을 띄우면 workqueue 는 동시 실행을 막고 tbb 는 종료 시 멈춤)
+    _convert_pixels = njit(nogil=True, cache=True, fastmath=True)(_convert_pixels)
+else:
+    _convert_pixels = _convert_pixels_numpy
+
+def _rgb_to_array(rgb: np.ndarray, palette: np.ndarray = None) -> np.ndarray:
+    """(H, W, 3) RGB 배열을 그대로 반환하거나 팔레트 인덱스로 변환"""
+    if palette is None:
+        return rgb
+    
+    palette = np.ascontiguousarray(palette, dtype=np.uint8).reshape(-1, 3)
+    out = np.empty(rgb.shape[:2], dtype=np.uint8)
+    _convert_pixels(rgb, out, palette)
+    return out
+
+def pixel_image_to_array(image: Image.Image, bin_path: str, palette: np.ndarray = None) -> np.ndarray:
+    """이미지 변환 처리 (palette 가 주어지면 (H, W) 팔레트 인덱스, 아니면 (H, W, 3) RGB 배열)"""
+    # 배열 변환/팔레트 준비는 JIT 커널 바깥에서 처리
+    rgb = np.asarray(image.convert('RGB'), dtype=np.uint8)
+    return _rgb_to_array(rgb, palette)
+
+def _decode_rgb_vips(data: bytes) -> np.ndarray:
+    """pyvips 로 8비트 sRGB(A) 이미지를 (H, W, 3) 배열로 디코딩 (그 외 형식이면 None 을 반환해 PIL 로 처리)"""
+    if pyvips is None:
+        return None
+    try:
+        v = pyvips.Image.new_from_buffer(data, '', access='sequential')
+    except pyvips.Error:
+        return None
+    if v.format != 'uchar' or v.interpretation != 'srgb' or v.bands not in (3, 4):
+        return None
+    
+    rgb = np.ndarray(buffer=v.write_to_memory(), dtype=np.uint8, shape=(v.height, v.width, v.bands))
+    # 알파 채널은 PIL 의 convert('RGB') 와 같이 버림
+    return np.ascontiguousarray(rgb[:, :, :3])
+
+# 실행 간에 유지되는 변환 결과 캐시 (.npy, mmap 으로 바로 읽음)
+# PIXELART_TO_BIN_CACHE_DIR 로 위치를 바꾸고, PIXELART_TO_BIN_NO_CACHE=1 이면 사용하지 않음
+CACHE_DIR = os.environ.get('PIXELART_TO_BIN_CACHE_DIR') or os.path.join(os.path.expanduser('~'), '.cache', 'pixelart-to-bin')
+# 변환 결과의 형식이 바뀌면 올려서 이전 캐시 항목을 무효화 (해시 키에 포함)
+CACHE_VERSION = 1
+# 디스크 캐시 최대 크기 (넘으면 오래 쓰이지 않은 항목부터 삭제)
+CACHE_MAX_BYTES = 1 << 30
+
+def _disk_cache_enabled() -> bool:
+    """환경 변수로 디스크 캐시가 꺼져 있지 않으면 True"""
+    return os.environ.get('PIXELART_TO_BIN_NO_CACHE', '') in ('', '0')
+
+def _load_cached_array(key: bytes) -> Any:
+    """디스크 캐시에서 변환된 배열을 읽음 (없거나 깨졌으면 None, 읽으면 수정 시각을 갱신)"""
+    cache_path = os.path.join(CACHE_DIR, key.hex() + '.npy')
+    try:
+        array = np.load(cache_path, mmap_mode='r')
+    except (OSError, ValueError):
+        return None
+    try:
+        os.utime(cache_path)
+    except OSError:
+        pass
+    return array
+
+def _save_cached_array(key: bytes, array: Any) -> None:
+    """변환된 배열을 디스크 캐시에 저장 (임시 파일에 쓴 뒤 교체, 실패는 무시)"""
+    if not isinstance(array, np.ndarray) or array.dtype.hasobject:
+        return
+    cache_path = os.path.join(CACHE_DIR, key.hex() + '.npy')
+    tmp_path = None
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # 스레드/프로세스마다 고유한 임시 파일 이름
+        with tempfile.NamedTemporaryFile(dir=CACHE_DIR, suffix='.tmp', delete=False) as f:
+            tmp_path = f.name
+            np.save(f, array)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+def _prune_disk_cache(max_bytes: int = CACHE_MAX_BYTES) -> None:
+    """디스크 캐시가 max_bytes 를 넘으면 수정 시각이 오래된 항목부터 삭제"""
+    entries = []
+    try:
+        with os.scandir(CACHE_DIR) as it:
+            for entry in it:
+                if entry.name.endswith('.npy'):
+                    st = entry.stat()
+                    entries.append((st.st_mtime_ns, st.st_size, entry.path))
+    except OSError:
+        return
+    
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+
+def _load_and_convert(path: str, bin_path: str, convert_cache: Dict[bytes, Any], palette: np.ndarray = None, disk_cache: bool = True) -> Any:
+    """이미지 파일을 읽어 (이미지, 팔레트) 해시로 캐시를 조회하고, 없으면 디코딩 후 변환 (워커 스레드에서 실행)"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    hasher = hashlib.blake2b(data, digest_size=16)
+    hasher.update(struct.pack('<I', CACHE_VERSION))
+    if palette is not None:
+        hasher.update(np.ascontiguousarray(palette, dtype=np.uint8).tobytes())
+    key = hasher.digest()
     
+    array = convert_cache.get(key)
+    if array is None and disk_cache:
+        array = _load_cached_array(key)
+    if array is None:
+        rgb = _decode_rgb_vips(data)
+        if rgb is not None:
+            array = _rgb_to_array(rgb, palette)
+        else:
+            img = Image.open(io.BytesIO(data))
+            img.load()  # 지연 디코딩을 워커 안에서 강제 (디코딩 중 GIL 해제)
+            array = pixel_image_to_array(img, bin_path, palette)
+        if disk_cache:
+            _save_cached_array(key, array)
+    convert_cache[key] = array
+    return array
+
+def load_images_and_convert(image_paths: List[str], bin_path: str, palette: np.ndarray = None, disk_cache: bool = None, threads: int = None) -> Union[np.ndarray, List[Any]]:
+    """이미지 파일들을 로드하고 배열로 변환 (palette 가 있으면 팔레트 인덱스, 모두 같은 크기면 (N, ...) 연속 ndarray 하나로 반환, disk_cache 기본값은 환경 변수, threads 기본값은 CPU 수)"""
+    if not image_paths:
+        return []
+    if disk_cache is None:
+        disk_cache = _disk_cache_enabled()
+    
+    # 파일 내용 해시 -> 변환된 배열 (호출 안에서 같은 이미지가 여러 번 나오면 디코딩/변환을 재사용)
+    convert_cache: Dict[bytes, Any] = {}
+    
+    # 파일 읽기/해시/디코딩/변환을 스레드 풀에서 병렬 처리 (결과 순서는 유지)
+    with ThreadPoolExecutor(max_workers=min(len(image_paths), threads or os.cpu_count() or 1)) as ex:
+        arrays = list(ex.map(lambda path: _load_and_convert(path, bin_path, convert_cache, palette, disk_cache), image_paths))
+    
+    # 디스크 캐시에서 읽은 (memmap) 것 외의 결과가 있으면 새로 저장된 항목이 있으므로 크기 제한 적용
+    if disk_cache and not all(isinstance(a, np.memmap) for a in arrays):
+        _prune_disk_cache()
+    
+    first = arrays[0]
+    if all(a.shape == first.shape and a.dtype == first.dtype for a in arrays):
+        return np.stack(arrays)
+    return arrays
+
+@lru_cache(maxsize=1024)
+def _load_config_cached(config_path: str, mtime_ns: int, size: int) -> Dict:
+    """(경로, 수정 시각, 크기) 를 키로 파싱된 설정을 캐시"""
     with open(config_path, 'r') as f:
         return json.load(f)
+
+def load_config(config_path: str) -> Dict:
+    """설정 파일 로드 (파일이 바뀌지 않았으면 캐시된 dict 를 재사용, 수정하지 말 것)"""
+    try:
+        st = os.stat(config_path)
+    except FileNotFoundError:
+        return {}
     
-def add_header(data_arrays: List[Any], mode: str) -> bytes:
-    """배열 데이터에 bin 파일 헤더 추가"""
-    # 헤더 형식은 실제 요구사항에 맞게 구현해야 함
-    header = bytearray()
+    return _load_config_cached(config_path, st.st_mtime_ns, st.st_size)
     
-    # 모드 정보 추가
-    header.extend(mode.encode('utf-8'))
+def encode_metadata(metadata: Dict) -> bytes:
+    """메타데이터를 공백 없는 UTF-8 JSON 바이트로 직렬화 (orjson 이 있으면 사용, dict/list/str/숫자 값은 두 경로의 출력이 같음)"""
+    if orjson is not None:
+        return orjson.dumps(metadata, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    # orjson 과 같게 비 ASCII 문자는 그대로 UTF-8 로 쓰고, 표준 JSON 이 아닌 NaN/Infinity 는 거부
+    return json.dumps(metadata, ensure_ascii=False, separators=(',', ':'), allow_nan=False).encode('utf-8')
 
+def _freeze_metadata(value: Any) -> Any:
+    """메타데이터를 해시 가능한 키로 변환 (dict 순서와 값의 타입까지 보존)"""
+    if isinstance(value, dict):
+        return (dict, tuple((k, _freeze_metadata(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (list, tuple(_freeze_metadata(v) for v in value))
+    return (type(value), value)
+
+def _thaw_metadata(key: Any) -> Any:
+    """_freeze_metadata 의 역변환"""
+    kind, value = key
+    if kind is dict:
+        return {k: _thaw_metadata(v) for k, v in value}
+    if kind is list:
+        return [_thaw_metadata(v) for v in value]
+    return value
+
+@lru_cache(maxsize=1024)
+def _encode_metadata_cached(key: Any) -> bytes:
+    """고정된 메타데이터 키를 기준으로 인코딩 결과를 캐시"""
+    return encode_metadata(_thaw_metadata(key))
+
+def encode_metadata_cached(metadata: Dict) -> bytes:
+    """같은 설정을 공유하는 폴더끼리 인코딩된 메타데이터를 재사용"""
+    try:
+        return _encode_metadata_cached(_freeze_metadata(metadata))
+    except TypeError:
+        # 해시할 수 없는 값 (예: numpy 배열) 은 캐시 없이 인코딩
+        return encode_metadata(metadata)
+
+def add_header(data_arrays: Union[List[Any], int], mode: str, metadata: Dict = None, metadata_bytes: bytes = None) -> bytes:
+    """배열 데이터에 bin 파일 헤더 추가 (data_arrays 대신 배열 수를 넘길 수 있음, metadata_bytes 가 있으면 인코딩을 생략)"""
+    # 헤더 형식은 실제 요구사항에 맞게 구현해야 함
+    mode_bytes = mode.encode('utf-8')
+    if metadata_bytes is None:
+        metadata_bytes = encode_metadata(metadata or {})
+    
     # TODO: 실제 헤더 정보 추가
     # 예: 버전, 크기, 타임스탬프 등
     
-    # 데이터 배열 수 추가
-    header.extend(len(data_arrays).to_bytes(4, byteorder='little'))
+    # 최종 크기를 미리 계산해 한 번에 할당한 뒤 오프셋에 기록
+    # 모드 정보 + 데이터 배열 수 (4바이트) + 메타데이터 (형식 태그 1바이트 + 길이 4바이트 + 본문)
+    array_count = data_arrays if isinstance(data_arrays, int) else len(data_arrays)
+    header = bytearray(len(mode_bytes) + 9 + len(metadata_bytes))
+    offset = len(mode_bytes)
+    header[:offset] = mode_bytes
+    struct.pack_into('<IBI', header, offset, array_count, METADATA_FORMAT_JSON, len(metadata_bytes))
+    offset += 9
+    header[offset:] = metadata_bytes
     
     return bytes(header)
 
-def add_tailing(data: bytes) -> bytes:
-    """bin 파일 테일링 추가"""
+def add_tailing(chunks: List[Any]) -> List[Any]:
+    """bin 파일 테일링 추가 (버퍼 목록 뒤에 테일링 버퍼를 덧붙임)"""
     # 테일링 정보 추가 (체크섬, 끝 표시 등)
     tailing = bytearray()
     
-    # 예: 체크섬 추가
-    checksum = sum(data) % 256
+    # 예: 체크섬 추가 (버퍼별 바이트 합을 NumPy 벡터 연산으로 누적)
+    checksum = 0
+    for chunk in chunks:
+        checksum = (checksum + int(np.frombuffer(chunk, dtype=np.uint8).sum(dtype=np.uint64))) % 256
     tailing.extend(checksum.to_bytes(1, byteorder='little'))
     
     # 끝 표시 추가
     tailing.extend(b'END')
     
-    return data + bytes(tailing)
+    chunks.append(bytes(tailing))
+    return chunks
+
+def pack_loop(loop: Union[int, float], loop_delay: int) -> bytes:
+    """루프 정보를 고정 레이아웃으로 직렬화"""
+    return LOOP_STRUCT.pack(-1 if loop == infinity else int(loop), loop_delay)
+
+def pack_text_timing(duration: List[int], action: List[str]) -> bytes:
+    """텍스트 duration (개수 + int32 배열) 과 action (개수 + 1바이트 코드) 직렬화"""
+    duration = _as_int32_array(duration)
+    action = action or []
+    if sys.byteorder != 'little':
+        duration = array('i', duration)
+        duration.byteswap()
+    return (
+        struct.pack('<I', len(duration))
+        + duration.tobytes()
+        + struct.pack('<I', len(action))
+        + bytes(ACTION_CODES[a] for a in action)
+    )
+
+def ndarray_header(array: np.ndarray, kind: int = ARRAY_KIND_NDARRAY, bits: int = None) -> bytes:
+    """ndarray 원시 덤프용 헤더 (종류 태그, dtype, 원소당 비트 수, shape)"""
+    dtype_str = array.dtype.str.encode('ascii')
+    if bits is None:
+        bits = array.dtype.itemsize * 8
+    return struct.pack(
+        f'<BB{len(dtype_str)}sBB{array.ndim}Q',
+        kind, len(dtype_str), dtype_str, bits, array.ndim, *array.shape
+    )
+
+def pack_nibbles(array: np.ndarray) -> np.ndarray:
+    """0~15 값만 갖는 uint8 배열을 한 바이트에 두 값씩 (상위/하위 4비트) 패킹"""
+    flat = array.reshape(-1)
+    if flat.size % 2:
+        flat = np.append(flat, np.uint8(0))
+    return (flat[0::2] << 4) | flat[1::2]
 
-def array_to_bin_data(arrays: List[Any]) -> bytes:
-    """배열 데이터를 bin 데이터로 변환"""
-    bin_data = bytearray()
+def _encode_ndarray(array: np.ndarray, kind: int) -> Tuple[bytes, memoryview]:
+    """연속 ndarray 의 (헤더, 페이로드) 생성 (16색 이하 팔레트 인덱스 배열은 4비트로 패킹)"""
+    # 팔레트 인덱스는 (H, W) (스택이면 (N, H, W)) uint8 배열, RGB 는 채널 축이 있어 max 검사 없이 그대로 기록
+    index_ndim = 3 if kind == ARRAY_KIND_STACK else 2
+    if array.dtype == np.uint8 and array.ndim == index_ndim and array.size and array.max() < 16:
+        return ndarray_header(array, kind, 4), memoryview(pack_nibbles(array)).cast('B')
+    return ndarray_header(array, kind), memoryview(array).cast('B')
+
+def array_to_bin_data(arrays: Union[np.ndarray, List[Any]]) -> List[Any]:
+    """배열 데이터를 bin 데이터 버퍼 목록으로 변환 (복사 없이 writev 로 바로 기록)"""
+    if isinstance(arrays, np.ndarray) and not arrays.dtype.hasobject:
+        # (N, ...) 연속 배열은 헤더 1개 + 버퍼 1개로 한 번에 기록
+        header, payload = _encode_ndarray(np.ascontiguousarray(arrays), ARRAY_KIND_STACK)
+        return [struct.pack('<I', len(header) + len(payload)) + header, payload]
+    
+    chunks = []
     
     for array in arrays:
-        # 각 배열의 크기 정보 추가
-        # 실제 구현에서는 배열의 차원과 타입에 따라 달라질 수 있음
-        array_bytes = pickle.dumps(array)  # 예시: pickle을 사용하여 직렬화
-        bin_data.extend(len(array_bytes).to_bytes(4, byteorder='little'))
-        bin_data.extend(array_bytes)
+        if isinstance(array, np.ndarray) and array.flags.c_contiguous and not array.dtype.hasobject:
+            # 연속 메모리 ndarray는 pickle 없이 (dtype, shape) 헤더 + 원시 버퍼를 그대로 기록
+            header, payload = _encode_ndarray(array, ARRAY_KIND_NDARRAY)
+        else:
+            # 그 외 객체는 pickle (protocol 5) 로 직렬화
+            header = bytes([ARRAY_KIND_PICKLE])
+            payload = pickle.dumps(array, protocol=5)
+        
+        # 각 배열의 크기 정보 (헤더 + 페이로드) 와 헤더를 미리 할당한 버퍼 하나에 기록
+        prefix = bytearray(4 + len(header))
+        struct.pack_into('<I', prefix, 0, len(header) + len(payload))
+        prefix[4:] = header
+        chunks.append(prefix)
+        chunks.append(payload)
+    
+    return chunks
+
+def _write_bin_file_mmap(bin_path: str, buffers: List[memoryview], total: int) -> None:
+    """파일을 최종 크기로 늘린 뒤 mmap 에 버퍼를 직접 복사해 기록"""
+    with open(bin_path, 'w+b') as f:
+        f.truncate(total)
+        with mmap.mmap(f.fileno(), total, access=mmap.ACCESS_WRITE) as mm:
+            offset = 0
+            for buffer in buffers:
+                mm[offset:offset + buffer.nbytes] = buffer
+                offset += buffer.nbytes
+            mm.flush()
+
+def write_bin_file(bin_path: str, chunks: List[bytes]) -> None:
+    """여러 버퍼를 한 번에 BIN 파일에 기록 (큰 파일은 mmap, 그 외에는 writev)"""
+    buffers = [memoryview(chunk).cast('B') for chunk in chunks if len(chunk)]
+    total = sum(buffer.nbytes for buffer in buffers)
+    if total >= MMAP_WRITE_THRESHOLD:
+        _write_bin_file_mmap(bin_path, buffers, total)
+        return
     
-    return bytes(bin_data)
+    if not hasattr(os, 'writev'):
+        # writev 미지원 플랫폼 (Windows 등)
+        with open(bin_path, 'wb') as f:
+            f.writelines(buffers)
+        return
+    
+    fd = os.open(bin_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        index = 0
+        while index < len(buffers):
+            written = os.writev(fd, buffers[index:index + IOV_MAX])
+            # 부분 기록 시 남은 버퍼부터 이어서 기록
+            while written:
+                if written >= len(buffers[index]):
+                    written -= len(buffers[index])
+                    index += 1
+                else:
+                    buffers[index] = buffers[index][written:]
+                    written = 0
+    finally:
+        os.close(fd)
 
 def process_pixelart(input_data: PixelArtInput, bin_path: str) -> str:
     """픽셀아트 모드의 입력을 처리하여 BIN 파일을 생성하는 함수"""
-    # 헤더 추가
-    header = add_header(input_data.image_arrays, 'pixelart')
+    # 헤더 추가 (클러스터 정보는 헤더 메타데이터로 기록)
+    metadata_bytes = encode_metadata_cached({'cluster': input_data.cluster})
+    header = add_header(input_data.image_arrays, 'pixelart', metadata_bytes=metadata_bytes)
     
     # 이미지 배열들을 bin 데이터로 변환
     bin_data = array_to_bin_data(input_data.image_arrays)
     
-    # 클러스터 정보와 루프 정보를 bin 데이터에 추가
-    cluster_data = pickle.dumps(input_data.cluster)
-    loop_data = pickle.dumps({'loop': input_data.loop, 'loopDelay': input_data.loopDelay})
+    # 루프 정보를 bin 데이터에 추가
+    loop_data = pack_loop(input_data.loop, input_data.loopDelay)
     
-    # 전체 데이터 결합
-    total_data = header + cluster_data + loop_data + bin_data
+    # 전체 데이터를 이어붙이지 않고 버퍼 목록으로 구성
+    chunks = [header, loop_data, *bin_data]
     
     # 테일링 추가
-    final_data = add_tailing(total_data)
+    chunks = add_tailing(chunks)
     
     # BIN 파일 작성
-    with open(bin_path, 'wb') as f:
-        f.write(final_data)
+    write_bin_file(bin_path, chunks)
     
     return bin_path
 
@@ -130,54 +516,182 @@ def process_text(input_data: TextInput, bin_path: str) -> str:
     # 텍스트 이미지 배열들을 bin 데이터로 변환
     bin_data = array_to_bin_data(input_data.text_arrays)
     
-    # 텍스트 설정 정보를 bin 데이터에 추가
-    text_config = {
-        'loop': input_data.loop,
-        'duration': input_data.duration,
-        'action': input_data.action
-    }
-    config_data = pickle.dumps(text_config)
+    # 루프 정보를 bin 데이터에 추가
+    loop_data = pack_loop(input_data.loop, input_data.loopDelay)
+    
+    # 텍스트 설정 정보 (duration, action) 를 bin 데이터에 추가
+    timing_data = pack_text_timing(input_data.duration, input_data.action)
     
-    # 전체 데이터 결합
-    total_data = header + config_data + bin_data
+    # 전체 데이터를 이어붙이지 않고 버퍼 목록으로 구성
+    chunks = [header, loop_data, timing_data, *bin_data]
     
     # 테일링 추가
-    final_data = add_tailing(total_data)
+    chunks = add_tailing(chunks)
     
     # BIN 파일 작성
-    with open(bin_path, 'wb') as f:
-        f.write(final_data)
+    write_bin_file(bin_path, chunks)
     
     return bin_path
 
 def process_mixed(input_data: MixedInput, bin_path: str) -> str:
     """혼합 모드의 입력을 처리하여 BIN 파일을 생성하는 함수"""
-    # 헤더 추가
-    all_arrays = input_data.image_arrays + (input_data.text_arrays or [])
-    header = add_header(all_arrays, 'mixed')
+    # 헤더 추가 (클러스터 정보는 헤더 메타데이터로 기록)
+    text_arrays = input_data.text_arrays if input_data.text_arrays is not None else []
+    array_count = len(input_data.image_arrays) + len(text_arrays)
+    metadata_bytes = encode_metadata_cached({'cluster': input_data.cluster})
+    header = add_header(array_count, 'mixed', metadata_bytes=metadata_bytes)
     
     # 이미지 배열들과 텍스트 배열들을 bin 데이터로 변환
     image_bin_data = array_to_bin_data(input_data.image_arrays)
-    text_bin_data = array_to_bin_data(input_data.text_arrays) if input_data.text_arrays else b''
+    text_bin_data = array_to_bin_data(text_arrays)
+    
+    # 루프 정보를 bin 데이터에 추가
+    loop_data = pack_loop(input_data.loop, input_data.loopDelay)
     
-    # 혼합 설정 정보를 bin 데이터에 추가
-    mixed_config = {
-        'cluster': input_data.cluster,
-        'loop': input_data.loop,
-        'loopDelay': input_data.loopDelay,
-        'duration': input_data.duration,
-        'action': input_data.action
-    }
-    config_data = pickle.dumps(mixed_config)
+    # 텍스트 설정 정보 (duration, action) 를 bin 데이터에 추가
+    timing_data = pack_text_timing(input_data.duration, input_data.action)
     
-    # 전체 데이터 결합
-    total_data = header + config_data + image_bin_data + text_bin_data
+    # 전체 데이터를 이어붙이지 않고 버퍼 목록으로 구성
+    chunks = [header, loop_data, timing_data, *image_bin_data, *text_bin_data]
     
     # 테일링 추가
-    final_data = add_tailing(total_data)
+    chunks = add_tailing(chunks)
     
     # BIN 파일 작성
-    with open(bin_path, 'wb') as f:
-        f.write(final_data)
+    write_bin_file(bin_path, chunks)
+    
+    return bin_path
+
+
+def _natural_sort_key(text: str) -> List[Any]:
+    """숫자 부분을 정수로 비교하는 자연 정렬 키"""
+    return [int(c) if c.isdigit() else c for c in re.split(r'(\d+)', text)]
+
+def _parse_loop(config: Dict) -> Union[int, float]:
+    """config 의 loop 값 (-1 은 무한 반복)"""
+    loop = config.get('loop', infinity)
+    return infinity if loop == -1 else loop
+
+def _parse_cluster(config: Dict) -> Dict[int, List[int]]:
+    """config 의 cluster 값 (숫자 키만 사용)"""
+    cluster = config.get('cluster', {})
+    return {int(k): v for k, v in cluster.items() if str(k).isdigit()}
+
+def _parse_palette(config: Dict) -> np.ndarray:
+    """config 의 palette 값 ([[r, g, b], ...], 없으면 None)"""
+    palette = config.get('palette')
+    if not palette:
+        return None
+    return np.asarray(palette, dtype=np.uint8).reshape(-1, 3)
+
+def get_file_paths(directory: str, include_dir_mtime: bool = True) -> Tuple[List[str], str, int]:
+    """폴더를 한 번만 훑어 이미지 경로 목록(자연 정렬), config 경로, 원본 중 가장 최근 mtime 반환"""
+    image_paths = []
+    config_path = os.path.join(directory, 'config.json')
+    # 폴더 자체의 mtime 으로 파일 추가/삭제도 감지 (BIN 이 같은 폴더에 있으면 호출하는 쪽에서 따로 비교)
+    latest_mtime = os.stat(directory).st_mtime_ns if include_dir_mtime else 0
+    
+    with os.scandir(directory) as it:
+        for entry in it:
+            name = entry.name.lower()
+            if name == 'config.json':
+                config_path = entry.path
+            elif name.endswith(IMAGE_EXTENSIONS) and entry.is_file():
+                image_paths.append(entry.path)
+            else:
+                continue
+            latest_mtime = max(latest_mtime, entry.stat().st_mtime_ns)
+    
+    image_paths.sort(key=_natural_sort_key)
+    return image_paths, config_path, latest_mtime
+
+def _is_up_to_date(bin_path: str, source_mtime: int, folder_mtime: int = 0) -> bool:
+    """BIN 파일이 원본 (이미지, config.json) 보다 엄격히 최신이고, BIN 이 든 폴더가 BIN 이후에 바뀌지 않았으면 True"""
+    try:
+        bin_mtime = os.stat(bin_path).st_mtime_ns
+    except FileNotFoundError:
+        return False
+    # 타임스탬프 해상도가 거친 파일시스템에서 같은 시각에 수정된 원본은 다시 생성
+    # 폴더 mtime 은 BIN 파일 자체를 만들 때도 바뀌므로 같은 시각까지는 BIN 생성으로 간주
+    return bin_mtime > source_mtime and bin_mtime >= folder_mtime
+
+def generate_bin_file(bin_folder: str, mode: str, force: bool = False, threads: int = None) -> str:
+    """BIN 폴더 하나를 모드에 맞는 입력으로 읽어 BIN 파일을 생성하는 함수 (원본이 바뀌지 않았으면 건너뜀, threads 는 이미지 로드 스레드 수)"""
+    folder_name = os.path.basename(os.path.normpath(bin_folder))
+    bin_path = os.path.join(bin_folder, f"{folder_name}.bin")
+    
+    if mode == 'mixed':
+        # BIN 은 상위 폴더에 있으므로 하위 폴더의 mtime 은 원본으로 비교
+        sources = [get_file_paths(os.path.join(bin_folder, 'pixelart')),
+                   get_file_paths(os.path.join(bin_folder, 'text'))]
+        folder_mtime = 0
+    else:
+        sources = [get_file_paths(bin_folder, include_dir_mtime=False)]
+        folder_mtime = os.stat(bin_folder).st_mtime_ns
+    if not force and _is_up_to_date(bin_path, max(mtime for _, _, mtime in sources), folder_mtime):
+        return bin_path
+    
+    if mode == 'pixelart':
+        image_paths, config_path, _ = sources[0]
+        config = load_config(config_path)
+        input_data = PixelArtInput(
+            image_arrays=load_images_and_convert(image_paths, bin_path, _parse_palette(config), threads=threads),
+            cluster=_parse_cluster(config),
+            loop=_parse_loop(config),
+            loopDelay=config.get('loopDelay', 0)
+        )
+        return process_pixelart(input_data, bin_path)
+    
+    if mode == 'text':
+        text_paths, config_path, _ = sources[0]
+        config = load_config(config_path)
+        input_data = TextInput(
+            text_arrays=load_images_and_convert(text_paths, bin_path, _parse_palette(config), threads=threads),
+            loop=_parse_loop(config),
+            duration=config.get('duration', []),
+            action=config.get('action', []),
+            loopDelay=config.get('loopDelay', 0)
+        )
+        return process_text(input_data, bin_path)
+    
+    if mode == 'mixed':
+        (image_paths, pixel_config_path, _), (text_paths, text_config_path, _) = sources
+        pixel_config = load_config(pixel_config_path)
+        text_config = load_config(text_config_path)
+        input_data = MixedInput(
+            image_arrays=load_images_and_convert(image_paths, bin_path, _parse_palette(pixel_config), threads=threads),
+            cluster=_parse_cluster(pixel_config),
+            loop=_parse_loop(pixel_config),
+            loopDelay=pixel_config.get('loopDelay', 0),
+            text_arrays=load_images_and_convert(text_paths, bin_path, _parse_palette(text_config), threads=threads),
+            duration=text_config.get('duration'),
+            action=text_config.get('action')
+        )
+        return process_mixed(input_data, bin_path)
+    
+    raise ValueError(f"지원하지 않는 모드입니다: {mode}")
+
+def _process_one(bin_folder: str, mode: str, force: bool, threads: int) -> Tuple[str, str]:
+    """풀 워커에서 BIN 폴더 하나를 처리 (폴더 경로, BIN 파일 경로) 반환"""
+    return bin_folder, generate_bin_file(bin_folder, mode, force, threads)
+
+def TotalFunction(input_data: TotalFunctionInput, force: bool = False, jobs: int = None) -> List[str]:
+    """모드 디렉토리 아래의 모든 BIN 폴더(S#*)를 처리하여 생성된 BIN 파일 경로 목록 반환"""
+    with os.scandir(input_data.directory) as it:
+        bin_folders = sorted((entry.path for entry in it if entry.is_dir()), key=_natural_sort_key)
+    
+    jobs = jobs or os.cpu_count() or 1
+    if len(bin_folders) <= 1 or jobs == 1:
+        return [generate_bin_file(bin_folder, input_data.mode, force) for bin_folder in bin_folders]
     
-    return bin_path
\ No newline at end of file
+    # 폴더끼리는 독립적이므로 프로세스 풀에서 완료 순서대로 처리하고, 결과는 폴더 순서로 정렬
+    # 워커마다 이미지 로드 스레드를 CPU 수 / 프로세스 수로 제한 (프로세스 x 스레드 과다 생성 방지)
+    processes = min(jobs, len(bin_folders))
+    threads = max(1, (os.cpu_count() or 1) // processes)
+    worker = partial(_process_one, mode=input_data.mode, force=force, threads=threads)
+    chunksize = max(1, len(bin_folders) // (4 * jobs))
+    bin_paths = {}
+    with multiprocessing.Pool(processes=processes) as pool:
+        for bin_folder, bin_path in pool.imap_unordered(worker, bin_folders, chunksize=chunksize):
+            bin_paths[bin_folder] = bin_path
+    return [bin_paths[bin_folder] for bin_folder in bin_folders]
@@ -1,45 +1,125 @@
 from typing import List, Dict, Any, Tuple
-from PIL import Image, ImageDraw, ImageFont
+from functools import lru_cache, partial
+from concurrent.futures import ProcessPoolExecutor
 import sys
 import os
 import json
+import base64
 import numpy as np
 
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+# PIL and numba are imported where they are used, so importing the
+# coordinate helpers stays cheap
+_ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if _ROOT_DIR not in sys.path:
+    sys.path.append(_ROOT_DIR)
+
+
+# Image extensions considered when looking for a representative image
+IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg'}
+
+# Colors for each cluster (indexed by cluster id modulo the list length)
+CLUSTER_COLORS = [
+    '#FF0000',  # Red
+    '#00FF00',  # Green
+    '#0000FF',  # Blue
+    '#FFFF00',  # Yellow
+    '#FF00FF',  # Magenta
+    '#00FFFF',  # Cyan
+    '#FFA500',  # Orange
+    '#800080',  # Purple
+    '#FFC0CB',  # Pink
+    '#A52A2A',  # Brown
+]
+
+
+def pack_color(r: int, g: int, b: int) -> np.uint32:
+    """
+    Pack an RGB color into one uint32 matching the memory layout of an RGBX pixel.
+    
+    Args:
+        r, g, b: Color channels (0-255)
+        
+    Returns:
+        Packed color for writes into a uint32 view of an (H, W, 4) uint8 array
+    """
+    return np.array([r, g, b, 255], dtype=np.uint8).view(np.uint32)[0]
+
+
+def hex_to_packed(color: str) -> np.uint32:
+    """
+    Pack a '#RRGGBB' color string (see pack_color).
+    
+    Args:
+        color: Hex color string
+        
+    Returns:
+        Packed uint32 color
+    """
+    return pack_color(int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16))
+
+
+# Cluster colors pre-packed for direct uint32 writes (keyed by hex string)
+PACKED_CLUSTER_COLORS = {color: hex_to_packed(color) for color in CLUSTER_COLORS}
 
 
 def load_config(config_path: str) -> Dict[str, Any]:
     """
     Load configuration from JSON file.
     
+    The parsed file is cached until its mtime changes; treat the result as read-only.
+    
     Args:
         config_path: Path to the config.json file
         
     Returns:
         Dictionary containing configuration data
     """
+    return _load_config_cached(os.path.abspath(config_path), os.stat(config_path).st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _load_config_cached(config_path: str, mtime_ns: int) -> Dict[str, Any]:
     with open(config_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
 
-def calculate_set_coordinates(set_index: int, image_width: int, image_height: int, grid_size: int = 4) -> Tuple[int, int, int, int]:
+@lru_cache(maxsize=256)
+def get_cluster_colors(cluster_keys: Tuple[str, ...]) -> Tuple[Tuple[str, str], ...]:
+    """
+    Resolve the drawing order and color of each cluster in a config.
+    
+    Results are memoized on the key tuple, so a batch of directories sharing
+    the same cluster ids only sorts and filters them once.
+    
+    Args:
+        cluster_keys: Keys of the config's 'cluster' section
+        
+    Returns:
+        Tuple of (cluster_id, color) pairs, skipping 'loop' and 'loopDelay'
+    """
+    return tuple(
+        (cluster_id, CLUSTER_COLORS[int(cluster_id) % len(CLUSTER_COLORS)])
+        for cluster_id in sorted(cluster_keys)
+        if cluster_id not in ('loop', 'loopDelay')
+    )
+
+
+def calculate_set_coordinates(set_index, image_width: int, image_height: int, grid_size: int = 4):
     """
     Calculate the pixel coordinates for a given set index.
     
     Args:
-        set_index: Index of the set (0-based)
+        set_index: Index of the set (0-based), or an array of indices
         image_width: Width of the image
         image_height: Height of the image
         grid_size: Size of each grid cell (4x4 pixels)
         
     Returns:
-        Tuple of (x1, y1, x2, y2) coordinates
+        Tuple of (x1, y1, x2, y2) coordinates (arrays when set_index is an array)
     """
     sets_per_row = image_width // grid_size
-    sets_per_col = image_height // grid_size
     
-    row = set_index // sets_per_row
-    col = set_index % sets_per_row
+    row, col = np.divmod(set_index, sets_per_row)
     
     x1 = col * grid_size
     y1 = row * grid_size
@@ -49,6 +129,50 @@ def calculate_set_coordinates(set_index: int, image_width: int, image_height: in
     return x1, y1, x2, y2
 
 
+# Clusters smaller than this use the NumPy path (JIT dispatch overhead dominates)
+JIT_BBOX_MIN_SETS = 64
+
+
+def _cluster_bbox(indices: np.ndarray, sets_per_row: int, grid_size: int) -> Tuple[int, int, int, int]:
+    """
+    Compute the cluster bounding box in a single pass over the set indices.
+    
+    Args:
+        indices: Non-empty int64 array of set indices
+        sets_per_row: Number of sets per image row
+        grid_size: Size of each grid cell
+        
+    Returns:
+        Tuple of (x1, y1, x2, y2) coordinates for the bounding box
+    """
+    min_row = max_row = indices[0] // sets_per_row
+    min_col = max_col = indices[0] % sets_per_row
+    for i in range(1, indices.shape[0]):
+        row = indices[i] // sets_per_row
+        col = indices[i] % sets_per_row
+        min_row = min(min_row, row)
+        max_row = max(max_row, row)
+        min_col = min(min_col, col)
+        max_col = max(max_col, col)
+    
+    return min_col * grid_size, min_row * grid_size, (max_col + 1) * grid_size, (max_row + 1) * grid_size
+
+
+@lru_cache(maxsize=1)
+def _jit_cluster_bbox():
+    """
+    Compile _cluster_bbox with numba on first use.
+    
+    Returns:
+        The compiled kernel, or None when numba is not installed
+    """
+    try:
+        from numba import njit
+    except ImportError:  # numba is optional; fall back to the NumPy path
+        return None
+    return njit('UniTuple(int64, 4)(int64[:], int64, int64)', cache=True)(_cluster_bbox)
+
+
 def get_cluster_bounding_box(cluster_sets: List[int], image_width: int, image_height: int, grid_size: int = 4) -> Tuple[int, int, int, int]:
     """
     Calculate the bounding box that encompasses all sets in a cluster.
@@ -62,20 +186,162 @@ def get_cluster_bounding_box(cluster_sets: List[int], image_width: int, image_he
     Returns:
         Tuple of (x1, y1, x2, y2) coordinates for the bounding box
     """
-    if not cluster_sets:
+    if len(cluster_sets) == 0:
         return 0, 0, 0, 0
     
-    min_x, min_y = float('inf'), float('inf')
-    max_x, max_y = -1, -1
+    indices = np.ascontiguousarray(cluster_sets, dtype=np.int64)
+    if len(indices) >= JIT_BBOX_MIN_SETS and _jit_cluster_bbox() is not None:
+        x1, y1, x2, y2 = _jit_cluster_bbox()(indices, image_width // grid_size, grid_size)
+        return int(x1), int(y1), int(x2), int(y2)
+    
+    x1, y1, x2, y2 = calculate_set_coordinates(indices, image_width, image_height, grid_size)
+    
+    return int(x1.min()), int(y1.min()), int(x2.max()), int(y2.max())
+
+
+def draw_rectangle_outline(pixels: np.ndarray, x1: int, y1: int, x2: int, y2: int, color, width: int) -> None:
+    """
+    Draw a rectangle outline directly into a pixel array.
+    
+    Matches ImageDraw.rectangle(outline=..., width=...): the corners are
+    inclusive and the stroke grows inward.
+    
+    Args:
+        pixels: (H, W, 3) pixel array or (H, W) packed uint32 view to draw into (modified in place)
+        x1, y1, x2, y2: Inclusive rectangle corners
+        color: RGB color tuple, or a packed color for a uint32 view
+        width: Stroke width in pixels
+    """
+    pixels[y1:y1 + width, x1:x2 + 1] = color
+    pixels[max(y2 - width + 1, 0):y2 + 1, x1:x2 + 1] = color
+    pixels[y1:y2 + 1, x1:x1 + width] = color
+    pixels[y1:y2 + 1, max(x2 - width + 1, 0):x2 + 1] = color
+
+
+def render_set_label(set_text: str, font) -> Tuple['Image.Image', Tuple[int, int, int, int]]:
+    """
+    Rasterize a set index label once as a coverage mask.
+    
+    Args:
+        set_text: Label text
+        font: Font used for the label
+        
+    Returns:
+        Tuple of (L-mode glyph coverage mask, text bbox relative to the draw origin)
+    """
+    from PIL import Image, ImageDraw
+    
+    text_bbox = font.getbbox(set_text)
+    mask = Image.new('L', (text_bbox[2] - text_bbox[0], text_bbox[3] - text_bbox[1]))
+    ImageDraw.Draw(mask).text((-text_bbox[0], -text_bbox[1]), set_text, fill=255, font=font)
+    return mask, text_bbox
+
+
+def draw_set_label(image: 'Image.Image', draw, set_text: str, center_x: int, center_y: int,
+                   font, glyphs: Dict[str, Any]) -> None:
+    """
+    Draw a set index label (red text on a white box with a black border) centered on a point.
     
-    for set_idx in cluster_sets:
-        x1, y1, x2, y2 = calculate_set_coordinates(set_idx, image_width, image_height, grid_size)
-        min_x = min(min_x, x1)
-        min_y = min(min_y, y1)
-        max_x = max(max_x, x2)
-        max_y = max(max_y, y2)
+    Same pixels as drawing the text in place with ImageDraw (including glyph
+    parts that extend past the box, e.g. the font's top offset), but each
+    distinct label is rasterized only once and then blended in with its mask.
     
-    return int(min_x), int(min_y), int(max_x), int(max_y)
+    Args:
+        image: Image to draw into (modified in place)
+        draw: ImageDraw for image
+        set_text: Label text
+        center_x, center_y: Point to center the text on
+        font: Font used for the label
+        glyphs: Cache of render_set_label results, keyed by label text
+    """
+    if set_text not in glyphs:
+        glyphs[set_text] = render_set_label(set_text, font)
+    mask, text_bbox = glyphs[set_text]
+    text_w = text_bbox[2] - text_bbox[0]
+    text_h = text_bbox[3] - text_bbox[1]
+    
+    # Center the text
+    text_x = center_x - text_w // 2
+    text_y = center_y - text_h // 2
+    
+    # Draw text background
+    draw.rectangle([text_x - 2, text_y - 2, text_x + text_w + 2, text_y + text_h + 2],
+                   fill='white', outline='black')
+    if mask.width and mask.height:
+        image.paste((255, 0, 0), (text_x + text_bbox[0], text_y + text_bbox[1]), mask)
+
+
+def create_cluster_visualization_svg(image_path: str, cluster_config: Dict[str, Any], output_path: str, scale_factor: int = 50):
+    """
+    Write the cluster visualization as SVG instead of a raster image.
+    
+    The source image is embedded as-is and upscaled by the viewer with
+    pixelated rendering; the grid, outlines and labels are vector elements,
+    so the cost does not grow with scale_factor.
+    
+    Args:
+        image_path: Path to the representative image (e.g., XXX_1.png)
+        cluster_config: The 'cluster' section of config.json
+        output_path: Path to save the .svg file
+        scale_factor: Factor to scale up the image for better visibility
+    """
+    from PIL import Image
+    
+    with Image.open(image_path) as img:
+        width, height = img.size
+    with open(image_path, 'rb') as f:
+        image_data = base64.b64encode(f.read()).decode('ascii')
+    mime = 'image/jpeg' if os.path.splitext(image_path)[1].lower() in ('.jpg', '.jpeg') else 'image/png'
+    
+    scaled_width, scaled_height = width * scale_factor, height * scale_factor
+    grid_size = 4 * scale_factor
+    font_size = max(12, grid_size // 4)
+    char_width = font_size * 0.6  # approximate advance for label backgrounds
+    
+    grid_path = ''.join(f'M{x} 0V{scaled_height}' for x in range(0, scaled_width + 1, grid_size))
+    grid_path += ''.join(f'M0 {y}H{scaled_width}' for y in range(0, scaled_height + 1, grid_size))
+    
+    lines = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{scaled_width}" height="{scaled_height}" '
+        f'viewBox="0 0 {scaled_width} {scaled_height}" font-family="Arial, sans-serif" font-size="{font_size}">',
+        f'<image width="{scaled_width}" height="{scaled_height}" style="image-rendering:pixelated" '
+        f'href="data:{mime};base64,{image_data}"/>',
+        f'<path d="{grid_path}" stroke="black" stroke-width="1" fill="none"/>',
+    ]
+    
+    for cluster_id, color in get_cluster_colors(tuple(cluster_config.keys())):
+        cluster_sets = cluster_config[cluster_id]
+        
+        # Cluster bounding box (stroke kept inside the box like the raster output)
+        x1, y1, x2, y2 = (v * scale_factor for v in get_cluster_bounding_box(cluster_sets, width, height, 4))
+        lines.append(f'<rect x="{x1 + 1.5}" y="{y1 + 1.5}" width="{x2 - x1 - 3}" height="{y2 - y1 - 3}" '
+                     f'fill="none" stroke="{color}" stroke-width="3"/>')
+        
+        # Set borders and indices
+        set_x1, set_y1, _, _ = calculate_set_coordinates(
+            np.asarray(cluster_sets, dtype=np.int64), width, height, 4)
+        for set_idx, sx, sy in zip(cluster_sets, (set_x1 * scale_factor).tolist(), (set_y1 * scale_factor).tolist()):
+            text_w = char_width * len(str(set_idx))
+            center_x, center_y = sx + grid_size / 2, sy + grid_size / 2
+            lines.append(f'<rect x="{sx + 1}" y="{sy + 1}" width="{grid_size - 2}" height="{grid_size - 2}" '
+                         f'fill="none" stroke="{color}" stroke-width="2"/>')
+            lines.append(f'<rect x="{center_x - text_w / 2 - 2}" y="{center_y - font_size / 2 - 2}" '
+                         f'width="{text_w + 4}" height="{font_size + 4}" fill="white" stroke="black"/>')
+            lines.append(f'<text x="{center_x}" y="{center_y}" fill="red" text-anchor="middle" '
+                         f'dominant-baseline="central">{set_idx}</text>')
+        
+        # Cluster label
+        label_text = f"C{cluster_id}"
+        label_x, label_y = x1 + 5, y1 + 5
+        lines.append(f'<rect x="{label_x}" y="{label_y}" width="{char_width * len(label_text)}" height="{font_size}" '
+                     f'fill="white" stroke="black"/>')
+        lines.append(f'<text x="{label_x}" y="{label_y}" fill="black" dominant-baseline="hanging">{label_text}</text>')
+    
+    lines.append('</svg>')
+    
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines))
+    print(f"Cluster visualization saved to: {output_path}")
 
 
 def create_cluster_visualization(image_path: str, config_path: str, output_path: str, scale_factor: int = 50):
@@ -88,34 +354,39 @@ def create_cluster_visualization(image_path: str, config_path: str, output_path:
         output_path: Path to save the visualization
         scale_factor: Factor to scale up the image for better visibility
     """
+    from PIL import Image, ImageDraw, ImageFont
+    
     # Load configuration
     config = load_config(config_path)
     cluster_config = config['cluster']
     
-    # Load and scale up the image
-    original_img = Image.open(image_path).convert("RGB")
-    width, height = original_img.size
-    
-    # Scale up for better visibility
-    scaled_img = original_img.resize((width * scale_factor, height * scale_factor), Image.NEAREST)
-    scaled_width, scaled_height = scaled_img.size
-    
-    # Create drawing context
-    draw = ImageDraw.Draw(scaled_img)
-    
-    # Define colors for each cluster
-    cluster_colors = [
-        '#FF0000',  # Red
-        '#00FF00',  # Green
-        '#0000FF',  # Blue
-        '#FFFF00',  # Yellow
-        '#FF00FF',  # Magenta
-        '#00FFFF',  # Cyan
-        '#FFA500',  # Orange
-        '#800080',  # Purple
-        '#FFC0CB',  # Pink
-        '#A52A2A',  # Brown
-    ]
+    # Vector output: no rasterization at all
+    if output_path.lower().endswith('.svg'):
+        create_cluster_visualization_svg(image_path, cluster_config, output_path, scale_factor)
+        return
+    
+    # Load the image as a pixel array (only pixel data is needed from it)
+    with Image.open(image_path) as img:
+        if img.mode in ('RGB', 'RGBA'):
+            # Already RGB(A): skip the converted copy, alpha is dropped below
+            original_pixels = np.asarray(img)[:, :, :3]
+        else:
+            original_pixels = np.asarray(img.convert("RGB"))
+    height, width = original_pixels.shape[:2]
+    
+    # Pack the native pixels as RGBX so every pixel is a single uint32 store
+    native = np.empty((height, width, 4), dtype=np.uint8)
+    native[:, :, :3] = original_pixels
+    native[:, :, 3] = 255
+    
+    # Scale up for better visibility: write each native pixel into its
+    # scale_factor x scale_factor block of the drawing buffer in one pass
+    # (same result as a NEAREST resize, without a second full-size copy)
+    scaled_width, scaled_height = width * scale_factor, height * scale_factor
+    pixels = np.empty((scaled_height, scaled_width, 4), dtype=np.uint8)
+    canvas = pixels.view(np.uint32)[:, :, 0]
+    canvas.reshape(height, scale_factor, width, scale_factor)[...] = \
+        native.view(np.uint32)[:, None, :, None, 0]
     
     # Grid size (scaled)
     grid_size = 4 * scale_factor
@@ -124,45 +395,54 @@ def create_cluster_visualization(image_path: str, config_path: str, output_path:
     print(f"Scaled size: {scaled_width}x{scaled_height} pixels")
     print(f"Grid size: {grid_size} pixels")
     
-    # Draw grid lines for reference
-    for x in range(0, scaled_width + 1, grid_size):
-        draw.line([(x, 0), (x, scaled_height)], fill='black', width=1)
-    for y in range(0, scaled_height + 1, grid_size):
-        draw.line([(0, y), (scaled_width, y)], fill='black', width=1)
+    # Draw grid lines for reference (every grid_size-th row and column)
+    black = pack_color(0, 0, 0)
+    canvas[::grid_size, :] = black
+    canvas[:, ::grid_size] = black
     
-    # Draw cluster bounding boxes and labels
-    for cluster_id in sorted(cluster_config.keys()):
-        if cluster_id in ['loop', 'loopDelay']:
-            continue
-        
+    # Draw cluster bounding boxes and set borders as slice writes on the pixel array
+    clusters = []
+    for cluster_id, color in get_cluster_colors(tuple(cluster_config.keys())):
         cluster_sets = cluster_config[cluster_id]
-        color_idx = int(cluster_id) % len(cluster_colors)
-        color = cluster_colors[color_idx]
+        clusters.append((cluster_id, cluster_sets, color))
         
         print(f"Cluster {cluster_id}: sets {cluster_sets}, color: {color}")
         
+        packed = PACKED_CLUSTER_COLORS[color]
+        
         # Get bounding box for this cluster (scaled)
+        x1, y1, x2, y2 = get_cluster_bounding_box(cluster_sets, width, height, 4)
+        draw_rectangle_outline(canvas, x1 * scale_factor, y1 * scale_factor,
+                               x2 * scale_factor, y2 * scale_factor, packed, 3)
+        
+        # Draw set borders
+        set_x1, set_y1, set_x2, set_y2 = calculate_set_coordinates(
+            np.asarray(cluster_sets, dtype=np.int64), width, height, 4)
+        for sx1, sy1, sx2, sy2 in zip(set_x1 * scale_factor, set_y1 * scale_factor,
+                                      set_x2 * scale_factor, set_y2 * scale_factor):
+            draw_rectangle_outline(canvas, sx1, sy1, sx2, sy2, packed, 2)
+    
+    scaled_img = Image.frombuffer('RGBX', (scaled_width, scaled_height), pixels, 'raw', 'RGBX', 0, 1).convert('RGB')
+    draw = ImageDraw.Draw(scaled_img)
+    
+    try:
+        # Try to use a font (might not be available on all systems)
+        font = ImageFont.truetype("arial.ttf", size=max(12, grid_size // 4))
+    except:
+        # Fall back to default font
+        font = ImageFont.load_default()
+    
+    # Draw cluster labels and set indices (text stays on the ImageDraw path)
+    glyphs = {}  # set label -> pre-rendered glyph mask, independent of position
+    for cluster_id, cluster_sets, color in clusters:
         x1, y1, x2, y2 = get_cluster_bounding_box(cluster_sets, width, height, 4)
         x1_scaled = x1 * scale_factor
         y1_scaled = y1 * scale_factor
-        x2_scaled = x2 * scale_factor
-        y2_scaled = y2 * scale_factor
-        
-        # Draw bounding rectangle
-        draw.rectangle([x1_scaled, y1_scaled, x2_scaled, y2_scaled], 
-                      outline=color, width=3)
         
         # Draw cluster label
         label_x = x1_scaled + 5
         label_y = y1_scaled + 5
         
-        try:
-            # Try to use a font (might not be available on all systems)
-            font = ImageFont.truetype("arial.ttf", size=max(12, grid_size // 4))
-        except:
-            # Fall back to default font
-            font = ImageFont.load_default()
-        
         # Draw label background
         label_text = f"C{cluster_id}"
         bbox = draw.textbbox((label_x, label_y), label_text, font=font)
@@ -177,34 +457,19 @@ def create_cluster_visualization(image_path: str, config_path: str, output_path:
             set_x2_scaled = set_x2 * scale_factor
             set_y2_scaled = set_y2 * scale_factor
             
-            # Draw set border
-            draw.rectangle([set_x1_scaled, set_y1_scaled, set_x2_scaled, set_y2_scaled], 
-                          outline=color, width=2)
-            
             # Draw set index
             center_x = (set_x1_scaled + set_x2_scaled) // 2
             center_y = (set_y1_scaled + set_y2_scaled) // 2
             
-            set_text = str(set_idx)
-            text_bbox = draw.textbbox((center_x, center_y), set_text, font=font)
-            text_w = text_bbox[2] - text_bbox[0]
-            text_h = text_bbox[3] - text_bbox[1]
-            
-            # Center the text
-            text_x = center_x - text_w // 2
-            text_y = center_y - text_h // 2
-            
-            # Draw text background
-            draw.rectangle([text_x - 2, text_y - 2, text_x + text_w + 2, text_y + text_h + 2], 
-                          fill='white', outline='black')
-            draw.text((text_x, text_y), set_text, fill='red', font=font)
+            draw_set_label(scaled_img, draw, str(set_idx), center_x, center_y, font, glyphs)
     
     # Save the visualization
     scaled_img.save(output_path)
     print(f"Cluster visualization saved to: {output_path}")
 
 
-def create_cluster_visualization_from_directory(directory: str, scale_factor: int = 50, output_dir: str = None):
+def create_cluster_visualization_from_directory(directory: str, scale_factor: int = 50, output_dir: str = None,
+                                                image_files: List[str] = None):
     """
     Create a visualization of clusters from a directory containing images and config.json.
     
@@ -212,31 +477,30 @@ def create_cluster_visualization_from_directory(directory: str, scale_factor: in
         directory: Directory containing images and config.json
         scale_factor: Factor to scale up the image for better visibility
         output_dir: Directory to save the output file (default: same as input directory)
+        image_files: Previously scanned image file paths (default: scan the directory)
         
     Returns:
         Path to the generated visualization file
     """
     # Find representative image (first image in sorted order or specifically named)
-    import glob
-    
-    image_files = []
-    for ext in ['*.png', '*.jpg', '*.jpeg']:
-        image_files.extend(glob.glob(os.path.join(directory, ext)))
-    image_files = sorted(image_files)
+    if image_files is not None:
+        image_files = sorted(
+            os.path.basename(path) for path in image_files
+            if os.path.splitext(path)[1] in IMAGE_EXTENSIONS
+        )
+    else:
+        with os.scandir(directory) as it:
+            image_files = sorted(
+                entry.name for entry in it
+                if entry.is_file() and os.path.splitext(entry.name)[1] in IMAGE_EXTENSIONS
+            )
     
     if not image_files:
         raise FileNotFoundError(f"No image files found in {directory}")
     
     # Look for specifically named file (ending with _1) or use first image
-    representative_image = None
-    for img_file in image_files:
-        filename = os.path.basename(img_file)
-        if '_1.' in filename:
-            representative_image = img_file
-            break
-    
-    if not representative_image:
-        representative_image = image_files[0]
+    representative_name = next((name for name in image_files if '_1.' in name), image_files[0])
+    representative_image = os.path.join(directory, representative_name)
     
     config_file = os.path.join(directory, "config.json")
     
@@ -255,129 +519,29 @@ def create_cluster_visualization_from_directory(directory: str, scale_factor: in
     
     create_cluster_visualization(representative_image, config_file, output_file, scale_factor)
     return output_file
+
+
+def create_cluster_visualizations(directories: List[str], scale_factor: int = 50, max_workers: int = None) -> List[str]:
     """
-    Create a visualization of clusters on the representative image.
+    Create cluster visualizations for several directories in parallel.
+    
+    Each directory is rendered in its own worker process; only paths cross the
+    process boundary.
     
     Args:
-        image_path: Path to the representative image (e.g., XXX_1.png)
-        config_path: Path to the config.json file
-        output_path: Path to save the visualization
+        directories: Directories containing images and config.json
         scale_factor: Factor to scale up the image for better visibility
-    """
-    # Load configuration
-    config = load_config(config_path)
-    cluster_config = config['cluster']
-    
-    # Load and scale up the image
-    original_img = Image.open(image_path).convert("RGB")
-    width, height = original_img.size
-    
-    # Scale up for better visibility
-    scaled_img = original_img.resize((width * scale_factor, height * scale_factor), Image.NEAREST)
-    scaled_width, scaled_height = scaled_img.size
-    
-    # Create drawing context
-    draw = ImageDraw.Draw(scaled_img)
-    
-    # Define colors for each cluster
-    cluster_colors = [
-        '#FF0000',  # Red
-        '#00FF00',  # Green
-        '#0000FF',  # Blue
-        '#FFFF00',  # Yellow
-        '#FF00FF',  # Magenta
-        '#00FFFF',  # Cyan
-        '#FFA500',  # Orange
-        '#800080',  # Purple
-        '#FFC0CB',  # Pink
-        '#A52A2A',  # Brown
-    ]
-    
-    # Grid size (scaled)
-    grid_size = 4 * scale_factor
-    
-    print(f"Image size: {width}x{height} pixels")
-    print(f"Scaled size: {scaled_width}x{scaled_height} pixels")
-    print(f"Grid size: {grid_size} pixels")
-    
-    # Draw grid lines for reference
-    for x in range(0, scaled_width + 1, grid_size):
-        draw.line([(x, 0), (x, scaled_height)], fill='black', width=1)
-    for y in range(0, scaled_height + 1, grid_size):
-        draw.line([(0, y), (scaled_width, y)], fill='black', width=1)
-    
-    # Draw cluster bounding boxes and labels
-    for cluster_id in sorted(cluster_config.keys()):
-        if cluster_id in ['loop', 'loopDelay']:
-            continue
-        
-        cluster_sets = cluster_config[cluster_id]
-        color_idx = int(cluster_id) % len(cluster_colors)
-        color = cluster_colors[color_idx]
-        
-        print(f"Cluster {cluster_id}: sets {cluster_sets}, color: {color}")
-        
-        # Get bounding box for this cluster (scaled)
-        x1, y1, x2, y2 = get_cluster_bounding_box(cluster_sets, width, height, 4)
-        x1_scaled = x1 * scale_factor
-        y1_scaled = y1 * scale_factor
-        x2_scaled = x2 * scale_factor
-        y2_scaled = y2 * scale_factor
-        
-        # Draw bounding rectangle
-        draw.rectangle([x1_scaled, y1_scaled, x2_scaled, y2_scaled], 
-                      outline=color, width=3)
-        
-        # Draw cluster label
-        label_x = x1_scaled + 5
-        label_y = y1_scaled + 5
-        
-        try:
-            # Try to use a font (might not be available on all systems)
-            font = ImageFont.truetype("arial.ttf", size=max(12, grid_size // 4))
-        except:
-            # Fall back to default font
-            font = ImageFont.load_default()
-        
-        # Draw label background
-        label_text = f"C{cluster_id}"
-        bbox = draw.textbbox((label_x, label_y), label_text, font=font)
-        draw.rectangle(bbox, fill='white', outline='black')
-        draw.text((label_x, label_y), label_text, fill='black', font=font)
+        max_workers: Number of worker processes (default: CPU count)
         
-        # Draw set indices within each cluster
-        for set_idx in cluster_sets:
-            set_x1, set_y1, set_x2, set_y2 = calculate_set_coordinates(set_idx, width, height, 4)
-            set_x1_scaled = set_x1 * scale_factor
-            set_y1_scaled = set_y1 * scale_factor
-            set_x2_scaled = set_x2 * scale_factor
-            set_y2_scaled = set_y2 * scale_factor
-            
-            # Draw set border
-            draw.rectangle([set_x1_scaled, set_y1_scaled, set_x2_scaled, set_y2_scaled], 
-                          outline=color, width=2)
-            
-            # Draw set index
-            center_x = (set_x1_scaled + set_x2_scaled) // 2
-            center_y = (set_y1_scaled + set_y2_scaled) // 2
-            
-            set_text = str(set_idx)
-            text_bbox = draw.textbbox((center_x, center_y), set_text, font=font)
-            text_w = text_bbox[2] - text_bbox[0]
-            text_h = text_bbox[3] - text_bbox[1]
-            
-            # Center the text
-            text_x = center_x - text_w // 2
-            text_y = center_y - text_h // 2
-            
-            # Draw text background
-            draw.rectangle([text_x - 2, text_y - 2, text_x + text_w + 2, text_y + text_h + 2], 
-                          fill='white', outline='black')
-            draw.text((text_x, text_y), set_text, fill='red', font=font)
+    Returns:
+        Paths to the generated visualization files, in input order
+    """
+    if len(directories) <= 1 or max_workers == 1:
+        return [create_cluster_visualization_from_directory(d, scale_factor) for d in directories]
     
-    # Save the visualization
-    scaled_img.save(output_path)
-    print(f"Cluster visualization saved to: {output_path}")
+    render_one = partial(create_cluster_visualization_from_directory, scale_factor=scale_factor)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(render_one, directories))
 
 
 def analyze_image_grid(image_path: str, grid_size: int = 4):
@@ -388,6 +552,8 @@ def analyze_image_grid(image_path: str, grid_size: int = 4):
         image_path: Path to the image
         grid_size: Size of each grid cell
     """
+    from PIL import Image
+    
     img = Image.open(image_path)
     width, height = img.size
     
@@ -406,16 +572,19 @@ def analyze_image_grid(image_path: str, grid_size: int = 4):
     
     # Show set layout
     print("Set layout (reading order):")
-    for row in range(sets_per_col):
-        row_indices = []
-        for col in range(sets_per_row):
-            set_index = row * sets_per_row + col
-            row_indices.append(f"{set_index:2d}")
-        print(f"  Row {row}: {' '.join(row_indices)}")
+    layout = np.arange(total_sets).reshape(sets_per_col, sets_per_row)
+    for row, row_indices in enumerate(layout.tolist()):
+        print(f"  Row {row}: {' '.join(f'{set_index:2d}' for set_index in row_indices)}")
     print()
 
 
 if __name__ == "__main__":
+    # Directories given on the command line are rendered as a parallel batch
+    if len(sys.argv) > 1:
+        for output_file in create_cluster_visualizations(sys.argv[1:], scale_factor=50):
+            print(f"Visualization complete! Check {output_file}")
+        sys.exit(0)
+    
     # Configuration
     watermelon_dir = r"./data/watermelon"
     representative_image = os.path.join(watermelon_dir, "수박_1.png")
@@ -1,7 +1,9 @@
 import sys
 import os
 import argparse
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+_ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if _ROOT_DIR not in sys.path:
+    sys.path.append(_ROOT_DIR)
 from src.utils.bin_maker import bin_maker
 from src.utils.color_board_utils import create_blinking_color_frames, validate_rgb
 
@@ -19,7 +21,7 @@ def main():
     # Optional flags
     parser.add_argument('-w', '--width', type=int, default=12, help='Board width (default: 12)')
     parser.add_argument('--height', type=int, default=12, help='Board height (default: 12)')
-    parser.add_argument('-r', '--repeat', type=int, default=5, help='Number of blink cycles (default: 5)')
+    parser.add_argument('-n', '--repeat', type=int, default=5, help='Number of blink cycles (default: 5)')
     parser.add_argument('-f', '--frames-per-color', type=int, default=10, help='Frames per color (default: 10)')
     parser.add_argument('--fps', type=int, default=5, help='Frames per second (default: 5)')
     parser.add_argument('-o', '--output', type=str, help='Output filename (auto-generated if not specified)')
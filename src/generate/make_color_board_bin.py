@@ -0,0 +1,9 @@
+import sys
+import os
+_ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if _ROOT_DIR not in sys.path:
+    sys.path.append(_ROOT_DIR)
+from src.test.make_color_board import main
+
+if __name__ == "__main__":
+    main()
@@ -1,85 +1,201 @@
 from typing import List, Dict, Any
+from functools import lru_cache
 from PIL import Image
 import sys
 import os
 import json
-import glob
+import re
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+_ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if _ROOT_DIR not in sys.path:
+    sys.path.append(_ROOT_DIR)
 from src.utils.image2matrix import image_to_matrix
-from src.utils.bin_maker import bin_maker
+from src.utils.bin_maker import bin_maker, BinWriter
+
+# Splits file names into digit / non-digit chunks for natural sorting
+_NAT_RE = re.compile(r'(\d+)')
+
+# Image files whose (lowercased) names contain any of these are not animation frames
+EXCLUDE_PATTERNS = [
+    'visualization',  # cluster visualization files
+    'cluster_vis',    # alternative cluster vis naming
+    'comparison',     # comparison files
+    'config',         # config files (shouldn't be images anyway)
+    'readme',         # readme images
+    'sample',         # sample files
+    'example',        # example files
+]
+_EXCLUDE_RE = re.compile('|'.join(map(re.escape, EXCLUDE_PATTERNS)))
 
 
 def load_config(config_path: str) -> Dict[str, Any]:
     """
     Load configuration from JSON file.
     
+    The parsed file is cached until its mtime changes; treat the result as read-only.
+    
     Args:
         config_path: Path to the config.json file
         
     Returns:
         Dictionary containing configuration data
     """
+    return _load_config_cached(os.path.abspath(config_path), os.stat(config_path).st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _load_config_cached(config_path: str, mtime_ns: int) -> Dict[str, Any]:
     with open(config_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
 
-def get_image_files_in_directory(directory: str) -> List[str]:
+# Countdown colors shown for one second each at the start of every loop
+COUNTDOWN_COLORS = [
+    (255, 0, 0),    # Red
+    (255, 255, 0),  # Yellow
+    (0, 255, 0),    # Green
+    (0, 0, 0),      # Black
+]
+
+
+def assemble_loop(images: np.ndarray, countdown_colors: np.ndarray, frames_per_color: int,
+                  delay_frames: int) -> np.ndarray:
+    """
+    Assemble one loop unit (countdown, images, delay) into one contiguous array.
+    
+    Args:
+        images: (N, H, W, 3) uint8 image frames
+        countdown_colors: (C, 3) uint8 countdown colors (C may be 0)
+        frames_per_color: Frames per countdown color
+        delay_frames: Black frames after the images
+        
+    Returns:
+        (C * frames_per_color + N + delay_frames, H, W, 3) uint8 array
+    """
+    countdown_frames = len(countdown_colors) * frames_per_color
+    out = np.empty((countdown_frames + len(images) + delay_frames,) + images.shape[1:], dtype=np.uint8)
+    
+    # Each countdown color fills its block of frames by broadcasting
+    blocks = out[:countdown_frames].reshape((len(countdown_colors), frames_per_color) + images.shape[1:])
+    blocks[...] = countdown_colors[:, None, None, None, :]
+    out[countdown_frames:countdown_frames + len(images)] = images
+    out[countdown_frames + len(images):] = 0
+    return out
+
+
+# Image file extensions picked up from an input directory (compared lowercased)
+IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.bmp', '.gif'}
+
+def list_image_files(directory: str) -> List[str]:
+    """
+    List the image files in a directory (unfiltered, unsorted).
+    
+    The result is cached until the directory's mtime changes, so the
+    validation, sequence and visualization steps share a single scan.
+    
+    Args:
+        directory: Directory path containing images
+        
+    Returns:
+        List of absolute image file paths
+    """
+    abs_dir = os.path.abspath(directory)
+    return list(_list_image_files_cached(abs_dir, os.stat(abs_dir).st_mtime_ns))
+
+
+@lru_cache(maxsize=32)
+def _list_image_files_cached(directory: str, mtime_ns: int) -> tuple:
+    # One directory pass; hidden files are skipped as glob would
+    with os.scandir(directory) as it:
+        return tuple(
+            entry.path for entry in it
+            if not entry.name.startswith('.') and entry.is_file()
+            and os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS
+        )
+
+
+def natural_sort_key(text: str) -> list:
+    """Convert a string into a list of string and number chunks for natural sorting."""
+    return [int(c) if c.isdigit() else c for c in _NAT_RE.split(text)]
+
+
+def get_image_files_in_directory(directory: str, image_files: List[str] = None) -> List[str]:
     """
     Get all image files in a directory sorted by filename (natural sort for numbers).
     Excludes visualization and config files.
     
     Args:
         directory: Directory path containing images
+        image_files: Previously scanned image file paths (default: scan the directory)
         
     Returns:
         Sorted list of image file paths (excluding visualization files)
     """
-    import re
-    
-    def natural_sort_key(text):
-        """Convert a string into a list of string and number chunks for natural sorting."""
-        return [int(c) if c.isdigit() else c for c in re.split(r'(\d+)', text)]
-    
-    image_extensions = ['*.png', '*.jpg', '*.jpeg', '*.bmp', '*.gif']
-    image_files = []
-    
-    for ext in image_extensions:
-        image_files.extend(glob.glob(os.path.join(directory, ext)))
+    if image_files is None:
+        image_files = list_image_files(directory)
     
     # Filter out visualization and other non-animation files
     filtered_files = []
     for file_path in image_files:
         filename = os.path.basename(file_path).lower()
-        # Exclude files with these patterns
-        exclude_patterns = [
-            'visualization',  # cluster visualization files
-            'cluster_vis',    # alternative cluster vis naming
-            'comparison',     # comparison files
-            'config',         # config files (shouldn't be images anyway)
-            'readme',         # readme images
-            'sample',         # sample files
-            'example',        # example files
-        ]
-        
         # Check if filename contains any exclude patterns
-        should_exclude = any(pattern in filename for pattern in exclude_patterns)
-        
-        if not should_exclude:
+        if _EXCLUDE_RE.search(filename) is None:
             filtered_files.append(file_path)
         else:
             print(f"Excluding file: {os.path.basename(file_path)}")
     
-    return sorted(filtered_files, key=natural_sort_key)
+    # Compute each sort key once (decorate-sort-undecorate)
+    keyed_files = [(natural_sort_key(file_path), file_path) for file_path in filtered_files]
+    keyed_files.sort()
+    return [file_path for _, file_path in keyed_files]
+
+
+def load_image_matrix(image_path: str) -> np.ndarray:
+    """
+    Decode one image file into an RGB matrix.
+    
+    Args:
+        image_path: Path to the image file
+        
+    Returns:
+        (height, width, 3) uint8 array
+    """
+    with Image.open(image_path) as img:
+        return image_to_matrix(img)
+
+
+# Most image decode threads per process (None: CPU count); batch workers lower it
+DECODE_WORKERS = None
+
+
+def load_image_matrices(image_paths: List[str]) -> List[np.ndarray]:
+    """
+    Decode image files in parallel (PIL releases the GIL while decoding).
+    
+    Args:
+        image_paths: List of image file paths
+        
+    Returns:
+        RGB matrices in the same order as image_paths
+    """
+    if len(image_paths) <= 1:
+        return [load_image_matrix(path) for path in image_paths]
+    
+    max_workers = min(len(image_paths), DECODE_WORKERS or os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(load_image_matrix, image_paths))
 
 
-def create_sequence_from_config(directory: str, output_path: str):
+def create_sequence_from_config(directory: str, output_path: str, image_files: List[str] = None):
     """
     Create binary sequence from images using config.json settings.
     
     Args:
         directory: Directory containing images and config.json
         output_path: Output binary file path
+        image_files: Previously scanned image file paths (default: scan the directory)
     """
     config_path = os.path.join(directory, 'config.json')
     if not os.path.exists(config_path):
@@ -92,153 +208,82 @@ def create_sequence_from_config(directory: str, output_path: str):
     countdown_enabled = config.get('countDown', True)
     
     # Get all image files
-    image_files = get_image_files_in_directory(directory)
+    image_files = get_image_files_in_directory(directory, image_files)
     print(f"Found {len(image_files)} image files:")
     for img_file in image_files:
         print(f"  {os.path.basename(img_file)}")
     
     # Create sequence from all sorted images
-    frames = []
     frame_duration = 0.2  # 0.2 seconds per frame
+    fps = int(1 / frame_duration)  # 5 FPS
     
     # Build image sequences from all sorted images
-    image_sequences = []
-    for image_file in image_files:
-        img = Image.open(image_file).convert("RGB")
-        matrix = image_to_matrix(img)
-        image_sequences.append(matrix)
+    image_sequences = load_image_matrices(image_files)
     
     if not image_sequences:
         print("No images found to process!")
         return
     
-    # Get image dimensions for countdown frames
-    image_height = len(image_sequences[0])
-    image_width = len(image_sequences[0][0])
+    # Stack the images into one (N, H, W, 3) array for frame assembly
+    images = np.stack(image_sequences)
     
-    def create_countdown_frames():
-        """Create countdown frames: red, yellow, green, black (1 second each)"""
-        countdown_frames = []
-        fps = int(1 / frame_duration)  # 5 FPS
-        frames_per_second = fps
-        
-        # 1 second red frame
-        red_frame = [[[255, 0, 0] for _ in range(image_width)] for _ in range(image_height)]
-        for _ in range(frames_per_second):
-            countdown_frames.append(red_frame)
-        
-        # 1 second yellow frame  
-        yellow_frame = [[[255, 255, 0] for _ in range(image_width)] for _ in range(image_height)]
-        for _ in range(frames_per_second):
-            countdown_frames.append(yellow_frame)
-        
-        # 1 second green frame
-        green_frame = [[[0, 255, 0] for _ in range(image_width)] for _ in range(image_height)]
-        for _ in range(frames_per_second):
-            countdown_frames.append(green_frame)
-        
-        # 1 second black frame
-        black_frame = [[[0, 0, 0] for _ in range(image_width)] for _ in range(image_height)]
-        for _ in range(frames_per_second):
-            countdown_frames.append(black_frame)
-        
-        return countdown_frames
+    # Countdown frames: red, yellow, green, black (1 second each)
+    countdown_colors = np.array(COUNTDOWN_COLORS if countdown_enabled else [], dtype=np.uint8).reshape(-1, 3)
+    countdown_frames_per_loop = len(countdown_colors) * fps
+    
+    # Calculate delay frames per loop (black frames for loopDelay)
+    delay_frames_per_loop = 0
+    if loop_delay_ms > 0:
+        delay_frames_per_loop = int((loop_delay_ms / 1000) / frame_duration)
+    
+    # Calculate total frames per loop (countdown + image frames + delay frames)
+    frames_per_loop = countdown_frames_per_loop + len(image_sequences) + delay_frames_per_loop
     
     # Handle loop settings
     if loop_count == -1:
         # Infinite loop for 1 hour (3600 seconds)
         total_duration = 3600  # 1 hour in seconds
-        
-        # Calculate delay frames per loop
-        delay_frames_per_loop = 0
-        if loop_delay_ms > 0:
-            delay_frames_per_loop = int((loop_delay_ms / 1000) / frame_duration)
-        
-        # Calculate countdown frames per loop (4 seconds = red + yellow + green + black)
-        countdown_frames_per_loop = 0
-        if countdown_enabled:
-            fps = int(1 / frame_duration)  # 5 FPS
-            countdown_frames_per_loop = 4 * fps  # 4 seconds * 5 FPS = 20 frames
-        
-        # Calculate total frames per loop (countdown + image frames + delay frames)
-        frames_per_loop = countdown_frames_per_loop + len(image_sequences) + delay_frames_per_loop
         sequence_duration_per_loop = frames_per_loop * frame_duration
         
         # Calculate how many loops we need for exactly 1 hour
-        loops_needed = int(total_duration / sequence_duration_per_loop)
+        loops = int(total_duration / sequence_duration_per_loop)
+        skip_last_delay = True  # no delay frames after the last loop
         
-        print(f"Creating 1-hour sequence with {loops_needed} loops")
+        print(f"Creating 1-hour sequence with {loops} loops")
         print(f"Frames per loop: {frames_per_loop} (countdown: {countdown_frames_per_loop}, images: {len(image_sequences)}, delay: {delay_frames_per_loop})")
         if countdown_enabled:
             print("Countdown frames enabled: 4 seconds per loop (red, yellow, green, black)")
         
-        for loop_idx in range(loops_needed):
-            # Add countdown frames at the beginning of each loop
-            if countdown_enabled:
-                countdown_frames = create_countdown_frames()
-                frames.extend(countdown_frames)
-            
-            # Add the actual image sequence
-            frames.extend(image_sequences)
-            
-            # Add delay frames (black frames for loopDelay) - except for the last loop
-            if loop_delay_ms > 0 and delay_frames_per_loop > 0 and image_sequences and loop_idx < loops_needed - 1:
-                # Create black frame with same dimensions
-                black_frame = [[[0, 0, 0] for _ in range(image_width)] for _ in range(image_height)]
-                
-                for _ in range(delay_frames_per_loop):
-                    frames.append(black_frame)
-        
         # Fill remaining time to exactly 1 hour if needed
-        current_duration = len(frames) * frame_duration
-        remaining_time = total_duration - current_duration
+        current_frames = loops * frames_per_loop - (delay_frames_per_loop if loops > 0 else 0)
+        remaining_time = total_duration - current_frames * frame_duration
+        tail_frames = 0
         if remaining_time > 0:
-            remaining_frames = int(remaining_time / frame_duration)
-            print(f"Adding {remaining_frames} frames to reach exactly 1 hour")
-            
-            # Add frames from the beginning of sequence to fill remaining time
-            frame_idx = 0
-            for _ in range(remaining_frames):
-                if frame_idx < len(image_sequences):
-                    frames.append(image_sequences[frame_idx])
-                    frame_idx += 1
-                else:
-                    frame_idx = 0
-                    frames.append(image_sequences[frame_idx])
-                    frame_idx += 1
+            tail_frames = int(remaining_time / frame_duration)
+            print(f"Adding {tail_frames} frames to reach exactly 1 hour")
     else:
         # Finite loop
         print(f"Creating sequence with {loop_count} loops")
         if countdown_enabled:
             print("Countdown frames enabled: 4 seconds per loop (red, yellow, green, black)")
         
-        for loop_idx in range(loop_count):
-            # Add countdown frames at the beginning of each loop
-            if countdown_enabled:
-                countdown_frames = create_countdown_frames()
-                frames.extend(countdown_frames)
-            
-            # Add the actual image sequence
-            frames.extend(image_sequences)
-            
-            # Add delay frames (black frames for loopDelay)
-            if loop_delay_ms > 0:
-                delay_frames = int((loop_delay_ms / 1000) / frame_duration)
-                if delay_frames > 0 and image_sequences:
-                    # Create black frame with same dimensions
-                    black_frame = [[[0, 0, 0] for _ in range(image_width)] for _ in range(image_height)]
-                    
-                    for _ in range(delay_frames):
-                        frames.append(black_frame)
+        loops = max(loop_count, 0)
+        skip_last_delay = False
+        tail_frames = 0
     
-    # Calculate FPS (frames per second)
-    fps = int(1 / frame_duration)  # 5 FPS for 0.2 seconds per frame
+    # Assemble one loop (countdown + images + delay) and stream it to disk
+    loop_frames = assemble_loop(images, countdown_colors, fps, delay_frames_per_loop)
+    last_loop_frames = loop_frames[:len(loop_frames) - delay_frames_per_loop] if skip_last_delay else loop_frames
     
-    # Save using bin_maker
-    bin_maker(frames, output_path, fps)
+    with BinWriter(output_path, fps) as writer:
+        for loop_idx in range(loops):
+            writer.write_frames(last_loop_frames if loop_idx == loops - 1 else loop_frames)
+        if tail_frames > 0:
+            # Cycle through the images to fill the tail, written as one block
+            writer.write_frames(np.resize(images, (tail_frames,) + images.shape[1:]))
     
-    total_duration = len(frames) * frame_duration
-    print(f"Total sequence duration: {total_duration:.1f} seconds ({len(frames)} frames)")
+    total_duration = writer.frame_count * frame_duration
+    print(f"Total sequence duration: {total_duration:.1f} seconds ({writer.frame_count} frames)")
 
 
 def save_bin_from_images(image_paths: List[str], output_path: str, fps: int = 1):
@@ -250,11 +295,7 @@ def save_bin_from_images(image_paths: List[str], output_path: str, fps: int = 1)
         output_path: Path to save the output binary file
         fps: Frames per second
     """
-    frames = []
-    for path in image_paths:
-        img = Image.open(path).convert("RGB")
-        matrix = image_to_matrix(img)
-        frames.append(matrix)
+    frames = load_image_matrices(image_paths)
 
     # Use bin_maker to save the frames
     bin_maker(frames, output_path, fps)
@@ -3,7 +3,7 @@
 Main script for pixelart-to-bin conversion.
 
 Usage:
-    python ./src/main.py <directory>
+    python ./src/main.py <directory> [--jobs N]
     
 Example:
     python ./src/main.py ./data/watermelon
@@ -17,12 +17,15 @@ Both files will be saved in the input directory with directory name as prefix.
 import sys
 import os
 import argparse
+import multiprocessing
+import traceback
 from pathlib import Path
 
 # Add project root to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from src.generate.make_sequence import create_sequence_from_config
+from src.generate import make_sequence
+from src.generate.make_sequence import create_sequence_from_config, list_image_files
 from src.cluster.cluster_expression import create_cluster_visualization_from_directory
 
 
@@ -53,11 +56,8 @@ def validate_directory(directory: str) -> str:
     if not os.path.exists(config_path):
         raise FileNotFoundError(f"config.json not found in {abs_dir}")
     
-    # Check for image files
-    import glob
-    image_files = []
-    for ext in ['*.png', '*.jpg', '*.jpeg', '*.bmp', '*.gif']:
-        image_files.extend(glob.glob(os.path.join(abs_dir, ext)))
+    # Check for image files (the scan is cached and reused by the later steps)
+    image_files = list_image_files(abs_dir)
     
     if not image_files:
         raise FileNotFoundError(f"No image files found in {abs_dir}")
@@ -87,33 +87,35 @@ def generate_output_paths(directory: str) -> tuple[str, str]:
     return bin_file, viz_file
 
 
-def create_binary_sequence(directory: str, output_path: str):
+def create_binary_sequence(directory: str, output_path: str, image_files: list[str] = None):
     """
     Create binary sequence file from directory.
     
     Args:
         directory: Input directory containing images and config.json
         output_path: Output path for the binary file
+        image_files: Previously scanned image file paths (default: scan the directory)
     """
     print(f"\n🔄 Creating binary sequence...")
     print(f"   Input: {directory}")
     print(f"   Output: {output_path}")
     
     try:
-        create_sequence_from_config(directory, output_path)
+        create_sequence_from_config(directory, output_path, image_files)
         print(f"✓ Binary sequence created successfully")
     except Exception as e:
         print(f"✗ Error creating binary sequence: {e}")
         raise
 
 
-def create_visualization(directory: str, output_path: str):
+def create_visualization(directory: str, output_path: str, image_files: list[str] = None):
     """
     Create cluster visualization image from directory.
     
     Args:
         directory: Input directory containing images and config.json
         output_path: Expected output path for the visualization file
+        image_files: Previously scanned image file paths (default: scan the directory)
     """
     print(f"\n🔄 Creating cluster visualization...")
     print(f"   Input: {directory}")
@@ -125,7 +127,8 @@ def create_visualization(directory: str, output_path: str):
         created_file = create_cluster_visualization_from_directory(
             directory, 
             scale_factor=50, 
-            output_dir=output_dir
+            output_dir=output_dir,
+            image_files=image_files
         )
         
         print(f"✓ Cluster visualization created successfully")
@@ -135,6 +138,124 @@ def create_visualization(directory: str, output_path: str):
         raise
 
 
+def process_directory(directory: str) -> tuple[str, str]:
+    """
+    Validate one dataset directory and create its binary sequence and visualization.
+    
+    Args:
+        directory: Input directory containing images and config.json
+        
+    Returns:
+        Tuple of (bin_file_path, visualization_file_path)
+    """
+    # Validate input directory
+    validated_dir = validate_directory(directory)
+    
+    # Generate output paths
+    bin_output, viz_output = generate_output_paths(validated_dir)
+    
+    print(f"\n📁 Processing directory: {os.path.basename(validated_dir)}")
+    print(f"📄 Will create:")
+    print(f"   • {os.path.basename(bin_output)}")
+    print(f"   • {os.path.basename(viz_output)}")
+    
+    # Scan the image files once and share the list between both steps
+    image_files = list_image_files(validated_dir)
+    
+    # Create binary sequence
+    create_binary_sequence(validated_dir, bin_output, image_files)
+    
+    # Create cluster visualization  
+    create_visualization(validated_dir, viz_output, image_files)
+    
+    # Final summary
+    print(f"\n🎉 Processing completed successfully!")
+    print(f"📁 Output files in: {validated_dir}")
+    print(f"   ✓ {os.path.basename(bin_output)}")
+    print(f"   ✓ {os.path.basename(viz_output)}")
+    
+    # File size information
+    if os.path.exists(bin_output):
+        bin_size = os.path.getsize(bin_output)
+        print(f"   📊 Binary file size: {bin_size:,} bytes")
+    
+    if os.path.exists(viz_output):
+        viz_size = os.path.getsize(viz_output)
+        print(f"   🖼️  Visualization size: {viz_size:,} bytes")
+    
+    return bin_output, viz_output
+
+
+def find_dataset_directories(directory: str) -> list[str]:
+    """
+    Find dataset subdirectories when directory is a directory of datasets.
+    
+    Args:
+        directory: Input directory path
+        
+    Returns:
+        Sorted subdirectories containing config.json, or an empty list if
+        directory is itself a dataset (or not a directory)
+    """
+    if not os.path.isdir(directory) or os.path.exists(os.path.join(directory, 'config.json')):
+        return []
+    
+    with os.scandir(directory) as it:
+        return sorted(
+            entry.path for entry in it
+            if entry.is_dir() and os.path.exists(os.path.join(entry.path, 'config.json'))
+        )
+
+
+def _init_batch_worker(decode_workers: int):
+    """
+    Cap the image decode threads of one batch worker process, so that
+    jobs x threads stays near the CPU count.
+    """
+    make_sequence.DECODE_WORKERS = decode_workers
+
+
+def _process_directory_safe(directory: str) -> tuple[str, str]:
+    """
+    Process one dataset directory, returning (directory, formatted traceback or '').
+    """
+    try:
+        process_directory(directory)
+        return directory, ''
+    except Exception:
+        return directory, traceback.format_exc()
+
+
+def process_directories(directories: list[str], jobs: int = 1):
+    """
+    Process several dataset directories, in parallel when jobs > 1.
+    
+    Args:
+        directories: Dataset directories containing images and config.json
+        jobs: Number of worker processes
+        
+    Raises:
+        RuntimeError: If any directory failed
+    """
+    print(f"📂 Processing {len(directories)} dataset directories with {jobs} job(s)")
+    
+    if jobs > 1 and len(directories) > 1:
+        workers = min(jobs, len(directories))
+        decode_workers = max(1, (os.cpu_count() or 1) // workers)
+        with multiprocessing.Pool(workers, initializer=_init_batch_worker, initargs=(decode_workers,)) as pool:
+            results = pool.map(_process_directory_safe, directories)
+    else:
+        results = [_process_directory_safe(directory) for directory in directories]
+    
+    failed = [(directory, error) for directory, error in results if error]
+    print(f"\n📊 Batch finished: {len(results) - len(failed)} succeeded, {len(failed)} failed")
+    for directory, error in failed:
+        print(f"   ✗ {os.path.basename(directory)}:\n{error}")
+    
+    if failed:
+        raise RuntimeError(f"{len(failed)} of {len(results)} directories failed")
+
+
 def main():
     """
     Main function to process pixelart directory and generate outputs.
@@ -146,12 +267,14 @@ def main():
 Examples:
     python ./src/main.py ./data/watermelon
     python ./src/main.py ./data/another_dataset
+    python ./src/main.py ./data --jobs 4
 
 The script will generate:
     - {directory_name}_sequence.bin
     - {directory_name}_cluster_visualization.png
 
-Both files will be saved in the input directory.
+Both files will be saved in the input directory. If the directory has no
+config.json, each subdirectory that has one is processed as a dataset.
         """
     )
     
@@ -167,6 +290,13 @@ Both files will be saved in the input directory.
         help='Scale factor for visualization (default: 50)'
     )
     
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Worker processes when directory contains several datasets (default: CPU count)'
+    )
+    
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -184,37 +314,12 @@ Both files will be saved in the input directory.
     print("=" * 50)
     
     try:
-        # Validate input directory
-        validated_dir = validate_directory(args.directory)
-        
-        # Generate output paths
-        bin_output, viz_output = generate_output_paths(validated_dir)
-        
-        print(f"\n📁 Processing directory: {os.path.basename(validated_dir)}")
-        print(f"📄 Will create:")
-        print(f"   • {os.path.basename(bin_output)}")
-        print(f"   • {os.path.basename(viz_output)}")
-        
-        # Create binary sequence
-        create_binary_sequence(validated_dir, bin_output)
-        
-        # Create cluster visualization  
-        create_visualization(validated_dir, viz_output)
-        
-        # Final summary
-        print(f"\n🎉 Processing completed successfully!")
-        print(f"📁 Output files in: {validated_dir}")
-        print(f"   ✓ {os.path.basename(bin_output)}")
-        print(f"   ✓ {os.path.basename(viz_output)}")
-        
-        # File size information
-        if os.path.exists(bin_output):
-            bin_size = os.path.getsize(bin_output)
-            print(f"   📊 Binary file size: {bin_size:,} bytes")
-        
-        if os.path.exists(viz_output):
-            viz_size = os.path.getsize(viz_output)
-            print(f"   🖼️  Visualization size: {viz_size:,} bytes")
+        # A directory of dataset directories is processed as a batch
+        dataset_dirs = find_dataset_directories(args.directory)
+        if dataset_dirs:
+            process_directories(dataset_dirs, args.jobs)
+        else:
+            process_directory(args.directory)
             
     except KeyboardInterrupt:
         print(f"\n❌ Process interrupted by user")
@@ -222,7 +327,6 @@ Both files will be saved in the input directory.
     except Exception as e:
         print(f"\n❌ Error: {e}")
         if args.verbose:
-            import traceback
             traceback.print_exc()
         sys.exit(1)
 
@@ -1,19 +1,122 @@
 import sys
 import os
-import random
 from typing import List, Tuple
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba 가 없으면 같은 커널을 파이썬으로 실행
+    njit = None
+    prange = range
+
+_ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if _ROOT_DIR not in sys.path:
+    sys.path.append(_ROOT_DIR)
 from src.utils.bin_maker import bin_maker
-from src.utils.color_board_utils import create_solid_color_frames, validate_rgb, create_rainbow_frames, create_sequential_pixel_frames, apply_luminance, create_sequential_fill_frames
+from src.utils.color_board_utils import validate_rgb, create_rainbow_frames, create_sequential_pixel_frames, apply_luminance, create_sequential_fill_frames
 
 
 import argparse
 
+def fade_colors(r: int, g: int, b: int, fade_frames: int, fade_in: bool = True) -> np.ndarray:
+    """
+    페이드 단계별 RGB 값을 한 번에 계산 (fade_frames x 3, uint8)
+    
+    Args:
+        r, g, b: 목표 RGB 값
+        fade_frames: 페이드 프레임 수
+        fade_in: True 면 꺼짐 → 목표색상, False 면 목표색상 → 꺼짐
+    """
+    if fade_frames > 1:
+        ratios = np.arange(fade_frames) / (fade_frames - 1)
+    else:
+        ratios = np.ones(fade_frames)
+    if not fade_in:
+        ratios = 1 - ratios
+    # 0 인 채널은 램프도 0 이므로 계산 생략 (np.rint 는 round() 와 같은 round-half-even)
+    colors = np.zeros((fade_frames, 3), dtype=np.uint8)
+    for ch, value in enumerate((r, g, b)):
+        if value:
+            colors[:, ch] = np.rint(value * ratios)
+    return colors
+
+
+def _render_psyche(out: np.ndarray, hold_frames: np.ndarray, cycle_starts: np.ndarray, on_color: np.ndarray,
+                   fade_out_colors: np.ndarray, fade_in_colors: np.ndarray):
+    """
+    사이키 주기(페이드 아웃 → 꺼짐 → 페이드 인 → 켜짐)를 out 버퍼에 기록 (주기별 병렬)
+    
+    Args:
+        out: (N, H, W, 3) uint8 출력 버퍼 (N 프레임 이후는 버림)
+        hold_frames: 주기별 꺼짐/켜짐 유지 프레임 수
+        cycle_starts: 주기별 시작 프레임 인덱스
+        on_color: 켜진 상태 RGB
+        fade_out_colors, fade_in_colors: (fade_frames, 3) 페이드 색상
+    """
+    total = out.shape[0]
+    fade_frames = fade_out_colors.shape[0]
+    for cycle in prange(hold_frames.shape[0]):
+        t = cycle_starts[cycle]
+        hold = hold_frames[cycle]
+        for k in range(2 * (fade_frames + hold)):
+            if t + k >= total:
+                break
+            if k < fade_frames:
+                for ch in range(3):
+                    out[t + k, :, :, ch] = fade_out_colors[k, ch]
+            elif k < fade_frames + hold:
+                out[t + k] = 0
+            elif k < 2 * fade_frames + hold:
+                for ch in range(3):
+                    out[t + k, :, :, ch] = fade_in_colors[k - fade_frames - hold, ch]
+            else:
+                for ch in range(3):
+                    out[t + k, :, :, ch] = on_color[ch]
+
+
+def _scale_luminance(frames: np.ndarray, luminance: float) -> np.ndarray:
+    """
+    프레임 전체에 휘도 비율 적용 (apply_luminance 와 같은 round-half-even, 프레임별 병렬)
+    
+    Args:
+        frames: (N, H, W, 3) uint8 프레임
+        luminance: 휘도 비율 (0.0-1.0)
+    """
+    out = np.empty_like(frames)
+    src = frames.reshape(frames.shape[0], -1)
+    dst = out.reshape(frames.shape[0], -1)
+    for t in prange(src.shape[0]):
+        for k in range(src.shape[1]):
+            dst[t, k] = np.uint8(min(255.0, np.rint(src[t, k] * luminance)))
+    return out
+
+
+if njit is not None:
+    _render_psyche = njit(cache=True, parallel=True)(_render_psyche)
+    _scale_luminance = njit(cache=True, parallel=True)(_scale_luminance)
+
+
+def scale_luminance(frames: np.ndarray, luminance: float) -> np.ndarray:
+    """
+    프레임 전체에 휘도 비율 적용
+    
+    Args:
+        frames: (N, H, W, 3) uint8 프레임
+        luminance: 휘도 비율 (0.0-1.0)
+    """
+    frames = np.ascontiguousarray(frames, dtype=np.uint8)
+    if njit is not None:
+        return _scale_luminance(frames, float(luminance))
+    # numba 가 없으면 같은 계산을 NumPy 로 한 번에
+    return np.rint(frames * luminance).clip(0, 255).astype(np.uint8)
+
+
 def create_psyche_frames(r: int, g: int, b: int, width: int, height: int, 
                         total_duration: float, fps: int,
                         min_interval: float = 1.0, 
                         max_interval: float = 3.0,
-                        fade_duration: float = 0.3) -> List[List[List[List[int]]]]:
+                        fade_duration: float = 0.3,
+                        rng: np.random.Generator = None) -> np.ndarray:
     """
     사이키 조명처럼 랜덤한 간격으로 깜빡이는 프레임 생성
     
@@ -25,45 +128,99 @@ def create_psyche_frames(r: int, g: int, b: int, width: int, height: int,
         min_interval: 최소 깜빡임 간격 (초)
         max_interval: 최대 깜빡임 간격 (초)
         fade_duration: 페이드 인/아웃 시간 (초)
+        rng: 난수 생성기 (기본값: np.random.default_rng())
     """
-    frames = []
-    current_time = 0.0
     fade_frames = int(fade_duration * fps)
+    if rng is None:
+        rng = np.random.default_rng()
     
+    # 1. 랜덤 간격(1~3초)을 배치로 미리 뽑고, 총 재생 시간 전에 시작하는 주기만 사용
+    #    (한 주기 = interval * 2 초이므로 첫 배치로 대개 충분)
+    intervals = []
+    current_time = 0.0
+    batch_size = int(total_duration / (2 * min_interval)) + 1 if min_interval > 0 else 64
     while current_time < total_duration:
-        # 랜덤 간격 선택 (1~3초)
-        interval = random.uniform(min_interval, max_interval)
-        interval_frames = int(interval * fps)
-        
-        # 1. 페이드 아웃 (켜진 상태 → 꺼짐)
-        for i in range(fade_frames):
-            ratio = 1 - (i / (fade_frames - 1) if fade_frames > 1 else 1)
-            rr = int(round(r * ratio))
-            gg = int(round(g * ratio))
-            bb = int(round(b * ratio))
-            frames.append(create_solid_color_frames(rr, gg, bb, width, height, 1)[0])
-        
-        # 2. 잠시 꺼진 상태 유지
-        off_frames = max(1, interval_frames - 2 * fade_frames)
-        frames.extend([create_solid_color_frames(0, 0, 0, width, height, 1)[0]] * off_frames)
-        
-        # 3. 페이드 인 (꺼짐 → 켜진 상태)
-        for i in range(fade_frames):
-            ratio = i / (fade_frames - 1) if fade_frames > 1 else 1
-            rr = int(round(r * ratio))
-            gg = int(round(g * ratio))
-            bb = int(round(b * ratio))
-            frames.append(create_solid_color_frames(rr, gg, bb, width, height, 1)[0])
-        
-        # 4. 잠시 켜진 상태 유지
-        on_frames = max(1, interval_frames - 2 * fade_frames)
-        frames.extend([create_solid_color_frames(r, g, b, width, height, 1)[0]] * on_frames)
-        
-        current_time += interval * 2  # 한 주기 완료
+        batch = rng.uniform(min_interval, max_interval, size=batch_size)
+        cycle_ends = current_time + np.cumsum(batch * 2)
+        cycle_starts = np.concatenate(([current_time], cycle_ends[:-1]))
+        used = int(np.count_nonzero(cycle_starts < total_duration))
+        intervals.append(batch[:used])
+        current_time = cycle_ends[used - 1]
+    intervals = np.concatenate(intervals) if intervals else np.empty(0)
     
-    return frames[:int(total_duration * fps)]  # 정확한 길이로 잘라내기
+    # 주기별 꺼짐/켜짐 유지 프레임 수 (페이드 구간 제외)
+    hold_frames = np.maximum(1, (intervals * fps).astype(np.int64) - 2 * fade_frames)
+    
+    # 2. 프레임 버퍼를 미리 할당하고 커널로 채움 (정확한 길이로 잘라내기)
+    generated_frames = int(np.sum(2 * (fade_frames + hold_frames)))
+    total_frames = min(generated_frames, int(total_duration * fps))
+    frames = np.empty((total_frames, height, width, 3), dtype=np.uint8)
+    
+    # 페이드 색상 LUT (주기마다 동일하므로 한 번만 계산)
+    fade_out_colors = fade_colors(r, g, b, fade_frames, fade_in=False)
+    fade_in_colors = fade_colors(r, g, b, fade_frames, fade_in=True)
+    on_color = np.array([r, g, b], dtype=np.uint8)
+    
+    cycle_starts = np.concatenate(([0], np.cumsum(2 * (fade_frames + hold_frames))[:-1])).astype(np.int64)
+    _render_psyche(frames, hold_frames, cycle_starts, on_color, fade_out_colors, fade_in_colors)
+    return frames
 
-if __name__ == "__main__":
+
+def create_solid_frames(r: int, g: int, b: int, width: int, height: int, frame_count: int) -> np.ndarray:
+    """
+    단색 프레임을 연속된 (frame_count, height, width, 3) uint8 배열로 생성
+    
+    Args:
+        r, g, b: RGB 값
+        width, height: 보드 크기
+        frame_count: 프레임 수
+    """
+    frames = np.empty((frame_count, height, width, 3), dtype=np.uint8)
+    frames[...] = (r, g, b)
+    return frames
+
+
+def create_gradient_frames(r: int, g: int, b: int, width: int, height: int,
+                           frame_count: int, fps: int) -> np.ndarray:
+    """
+    5초 주기(점등 2초, 하이라이트 1초, 소등 2초)로 반복되는 디졸브 프레임 생성
+    
+    Args:
+        r, g, b: 목표 RGB 값
+        width, height: 보드 크기
+        frame_count: 총 프레임 수 (남는 프레임은 검은색)
+        fps: 초당 프레임 수
+    """
+    # 한 주기(5초)에 필요한 프레임 수 계산
+    frames_per_cycle = 5 * fps  # 5초 * fps
+    frames_fade_in = 2 * fps    # 점등 2초
+    frames_highlight = 1 * fps   # 하이라이트 1초
+    frames_fade_out = 2 * fps   # 소등 2초
+    
+    # 전체 재생시간에 맞춰 반복 횟수 계산
+    total_cycles = max(1, frame_count // frames_per_cycle)
+    
+    # 한 주기의 프레임별 색상: 점등 → 하이라이트 → 소등
+    cycle_colors = np.concatenate([
+        fade_colors(r, g, b, frames_fade_in, fade_in=True),
+        np.tile(np.array([r, g, b], dtype=np.uint8), (frames_highlight, 1)),
+        fade_colors(r, g, b, frames_fade_out, fade_in=False),
+    ])
+    
+    # 남은 프레임은 검은색(0)으로 채워짐
+    cycle_total = total_cycles * frames_per_cycle
+    frames = np.zeros((max(cycle_total, frame_count), height, width, 3), dtype=np.uint8)
+    frames[:cycle_total] = np.tile(cycle_colors, (total_cycles, 1))[:, None, None, :]
+    return frames
+
+
+def main(argv: List[str] = None):
+    """
+    명령행 인자에 따라 컬러 보드 bin 파일 생성
+    
+    Args:
+        argv: 명령행 인자 (기본값: sys.argv[1:])
+    """
     parser = argparse.ArgumentParser(description="Create a solid color board bin file.")
     parser.add_argument("--rainbow", action="store_true", help="Create beautiful rainbow color animation")
     parser.add_argument("--sequential", action="store_true", help="Create sequential pixel lighting with rainbow colors")
@@ -88,7 +245,7 @@ if __name__ == "__main__":
     parser.add_argument("--max-interval", type=float, default=3.0, help="Maximum interval for psyche effect (seconds)")
     parser.add_argument("--fade", type=float, default=0.3, help="Fade duration for psyche effect (seconds)")
     parser.add_argument("--rainbow-steps", type=int, default=60, help="Number of rainbow color steps (more = smoother transition)")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Validate luminance
     if not (0.0 <= args.luminance <= 1.0):
@@ -134,7 +291,7 @@ if __name__ == "__main__":
         print(f"   Total frames: {len(frames)}")
         print(f"   FPS: {fps}")
         print(f"   Duration: {len(frames)/fps:.1f} seconds")
-        exit(0)
+        return
 
     # Sequential pixel mode handling
     if args.sequential:
@@ -170,7 +327,7 @@ if __name__ == "__main__":
         print(f"   Total frames: {len(frames)}")
         print(f"   FPS: {fps}")
         print(f"   Duration: {len(frames)/fps:.1f} seconds")
-        exit(0)
+        return
 
     # Rainbow mode handling
     if args.rainbow:
@@ -200,13 +357,11 @@ if __name__ == "__main__":
             steps=args.rainbow_steps
         )
         
+        frames = np.asarray(frames, dtype=np.uint8)
+        
         # Apply luminance to all frames if not 1.0
         if args.luminance != 1.0:
-            for frame_idx in range(len(frames)):
-                for row in range(height):
-                    for col in range(width):
-                        r, g, b = frames[frame_idx][row][col]
-                        frames[frame_idx][row][col] = list(apply_luminance(r, g, b, args.luminance))
+            frames = scale_luminance(frames, args.luminance)
         
         output_path = f"test_color_board_rainbow_off{args.off_seconds}s_luminance{args.luminance}.bin"
         
@@ -222,7 +377,7 @@ if __name__ == "__main__":
         print(f"   Frames: {len(frames)}")
         print(f"   FPS: {fps}")
         print(f"   Duration: {len(frames)/fps:.1f} seconds")
-        exit(0)
+        return
 
     r = args.r
     g = args.g
@@ -271,50 +426,14 @@ if __name__ == "__main__":
         print(f"   Fade duration: {args.fade}s")
         
     elif args.gradient:
-        frames = []
-        fps = args.fps
-        
-        # 한 주기(5초)에 필요한 프레임 수 계산
-        frames_per_cycle = 5 * fps  # 5초 * fps
-        frames_fade_in = 2 * fps    # 점등 2초
-        frames_highlight = 1 * fps   # 하이라이트 1초
-        frames_fade_out = 2 * fps   # 소등 2초
-        
-        # 전체 재생시간에 맞춰 반복 횟수 계산
-        total_cycles = max(1, frame_count // frames_per_cycle)
+        frames = create_gradient_frames(r, g, b, width, height, frame_count, fps)
+        total_cycles = max(1, frame_count // (5 * fps))
         
-        # 각 주기마다 프레임 생성
-        for _ in range(total_cycles):
-            # 1. 점등 (2초): 검은색 → 목표색상
-            for i in range(frames_fade_in):
-                ratio = i / (frames_fade_in - 1) if frames_fade_in > 1 else 1
-                rr = int(round(r * ratio))
-                gg = int(round(g * ratio))
-                bb = int(round(b * ratio))
-                frames.append(create_solid_color_frames(rr, gg, bb, width, height, 1)[0])
-            
-            # 2. 하이라이트 (1초): 목표색상 유지
-            frame = create_solid_color_frames(r, g, b, width, height, 1)[0]
-            for _ in range(frames_highlight):
-                frames.append(frame)
-            
-            # 3. 소등 (2초): 목표색상 → 검은색
-            for i in range(frames_fade_out):
-                ratio = 1 - (i / (frames_fade_out - 1) if frames_fade_out > 1 else 1)
-                rr = int(round(r * ratio))
-                gg = int(round(g * ratio))
-                bb = int(round(b * ratio))
-                frames.append(create_solid_color_frames(rr, gg, bb, width, height, 1)[0])
-        
-        # 남은 프레임은 검은색으로 채우기
-        while len(frames) < frame_count:
-            frames.append(create_solid_color_frames(0, 0, 0, width, height, 1)[0])
-            
         output_path = f"test_color_board_dissolve_R{r}_G{g}_B{b}_luminance{args.luminance}.bin"
         print(f"   Animation info: {total_cycles} cycles of 5-second dissolve (2s fade-in, 1s highlight, 2s fade-out)")
     else:
         # 단색 보드
-        frames = create_solid_color_frames(r, g, b, width, height, frame_count)
+        frames = create_solid_frames(r, g, b, width, height, frame_count)
         output_path = f"test_color_board_R{r}_G{g}_B{b}_luminance{args.luminance}.bin"
 
     # Save using bin_maker (includes add_metadata with header)
@@ -329,4 +448,8 @@ if __name__ == "__main__":
     print(f"   Size: {width}x{height}")
     print(f"   Frames: {len(frames)}")
     print(f"   FPS: {fps}")
-    print(f"   Duration: {len(frames)/fps} seconds")
\ No newline at end of file
+    print(f"   Duration: {len(frames)/fps} seconds")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,39 @@
 import struct
+import mmap
 import sys
 import os
 import re
+import math
 import glob
 import argparse
-from typing import Tuple, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
 from PIL import Image
 import numpy as np
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; frames are then scanned with NumPy
+    njit = None
+    prange = range
+
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
+# Precompiled header/trailer layouts (16 bytes each)
+_HDR = struct.Struct('<IIII')  # total_frames, height, width, fps
+_TRL = struct.Struct('<IQI')   # total_frames_check, save_time, end_marker
+
+_NAT_RE = re.compile(r'(\d+)')
+
+ORIGINAL_IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+# Widest width:height (either way) listed when guessing frame dimensions
+MAX_DEBUG_ASPECT = 4
+
 
 def natural_sort_key(text):
     """Convert a string into a list of string and number chunks for natural sorting."""
-    return [int(c) if c.isdigit() else c for c in re.split(r'(\d+)', text)]
+    return [int(c) if c.isdigit() else c for c in _NAT_RE.split(text)]
 
 
 def read_bin_header(file_path: str) -> Tuple[int, int, int, int]:
@@ -27,11 +47,7 @@ def read_bin_header(file_path: str) -> Tuple[int, int, int, int]:
         Tuple of (total_frames, height, width, fps)
     """
     with open(file_path, 'rb') as f:
-        header_data = f.read(16)  # 4 * 4 bytes = 16 bytes
-        if len(header_data) != 16:
-            raise ValueError("Could not read complete header")
-        total_frames, height, width, fps = struct.unpack('<IIII', header_data)
-        return total_frames, height, width, fps
+        return unpack_bin_header(f.read(_HDR.size))
 
 
 def read_bin_trailer(file_path: str, frame_data_size: int) -> Tuple[int, int, int]:
@@ -46,124 +62,142 @@ def read_bin_trailer(file_path: str, frame_data_size: int) -> Tuple[int, int, in
         Tuple of (total_frames_check, save_time, end_marker)
     """
     with open(file_path, 'rb') as f:
-        # Skip header (16 bytes) and frame data
-        f.seek(16 + frame_data_size)
-        trailer_data = f.read(16)  # 4 + 8 + 4 bytes = 16 bytes
-        if len(trailer_data) != 16:
-            raise ValueError("Could not read complete trailer")
-        total_frames_check, save_time, end_marker = struct.unpack('<IQI', trailer_data)
-        return total_frames_check, save_time, end_marker
+        # Skip header and frame data
+        f.seek(_HDR.size + frame_data_size)
+        return _unpack_trailer_at(f.read(_TRL.size), 0)
 
 
-def safe_read_frame_data(file_path: str, frame_index: int, height: int, width: int) -> List[List[List[int]]]:
+def _black_frame_flags(frames: np.ndarray) -> np.ndarray:
     """
-    Safely read a specific frame from the binary file with validation.
+    Flag frames whose bytes are all zero.
     
     Args:
-        file_path: Path to the binary file
-        frame_index: Index of the frame to read (0-based)
-        height: Height of the frame
-        width: Width of the frame
+        frames: (frames, frame_size) uint8 array
         
     Returns:
-        RGB matrix for the frame or None if failed
+        Boolean array, True for black (delay) frames
     """
-    frame_size = height * width * 3  # 3 bytes per pixel (RGB)
-    file_size = os.path.getsize(file_path)
+    flags = np.empty(frames.shape[0], dtype=np.bool_)
+    for i in prange(frames.shape[0]):
+        acc = 0
+        for k in range(frames.shape[1]):
+            acc |= frames[i, k]
+        flags[i] = acc == 0
+    return flags
+
+
+if njit is not None:
+    _black_frame_flags = njit(cache=True, parallel=True)(_black_frame_flags)
+
+
+def find_black_frames(frames: np.ndarray) -> np.ndarray:
+    """
+    Detect black (delay) frames among the given frames in one pass.
     
-    with open(file_path, 'rb') as f:
-        # Skip header (16 bytes) and previous frames
-        offset = 16 + frame_index * frame_size
-        
-        # Check if we have enough data
-        if offset + frame_size > file_size - 16:  # account for trailer
-            raise ValueError(f"Frame {frame_index} would read beyond file size. Offset: {offset}, Frame size: {frame_size}, File size: {file_size}")
-        
-        f.seek(offset)
-        frame_data = f.read(frame_size)
+    Args:
+        frames: (frames, height, width, 3) uint8 array
         
-        if len(frame_data) != frame_size:
-            raise ValueError(f"Could not read complete frame {frame_index}. Expected {frame_size} bytes, got {len(frame_data)} bytes")
+    Returns:
+        Boolean array, True for black frames
+    """
+    flat = frames.reshape(len(frames), -1)
+    if njit is not None:
+        return _black_frame_flags(flat)
+    return ~flat.any(axis=1)
+
+
+def map_bin_file(file_path: str) -> mmap.mmap:
+    """
+    Map a binary file read-only.
+    
+    The mapping stays valid after the file is closed and is released once it
+    and every frame view into it are no longer referenced.
+    
+    Args:
+        file_path: Path to the binary file
         
-        # Convert bytes to RGB matrix
-        matrix = []
-        byte_idx = 0
+    Returns:
+        Read-only mmap of the whole file
+    """
+    with open(file_path, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def unpack_bin_header(buffer) -> Tuple[int, int, int, int]:
+    """
+    Parse the header from the start of a binary file buffer.
+    
+    Args:
+        buffer: bytes-like object or mmap holding the file contents
         
-        for y in range(height):
-            row = []
-            for x in range(width):
-                r = frame_data[byte_idx]
-                g = frame_data[byte_idx + 1]
-                b = frame_data[byte_idx + 2]
-                row.append([r, g, b])
-                byte_idx += 3
-            matrix.append(row)
+    Returns:
+        Tuple of (total_frames, height, width, fps)
+    """
+    if len(buffer) < _HDR.size:
+        raise ValueError("Could not read complete header")
+    return _HDR.unpack_from(buffer, 0)
+
+
+def unpack_bin_trailer(buffer, frame_data_size: int) -> Tuple[int, int, int]:
+    """
+    Parse the trailer that follows the header and frame data in a binary file buffer.
+    
+    Args:
+        buffer: bytes-like object or mmap holding the file contents
+        frame_data_size: Size of frame data in bytes
         
-        return matrix
+    Returns:
+        Tuple of (total_frames_check, save_time, end_marker)
+    """
+    return _unpack_trailer_at(buffer, _HDR.size + frame_data_size)
 
 
-def read_frame_data(file_path: str, frame_index: int, height: int, width: int) -> List[List[List[int]]]:
+def _unpack_trailer_at(buffer, offset: int) -> Tuple[int, int, int]:
+    if len(buffer) < offset + _TRL.size:
+        raise ValueError("Could not read complete trailer")
+    return _TRL.unpack_from(buffer, offset)
+
+
+def frame_view(buffer, frame_index: int, height: int, width: int) -> np.ndarray:
     """
-    Read a specific frame from the binary file.
+    Get a specific frame from a binary file buffer as a zero-copy view, with validation.
     
     Args:
-        file_path: Path to the binary file
+        buffer: bytes-like object or mmap holding the file contents
         frame_index: Index of the frame to read (0-based)
         height: Height of the frame
         width: Width of the frame
         
     Returns:
-        RGB matrix for the frame
+        (height, width, 3) uint8 RGB matrix for the frame
     """
     frame_size = height * width * 3  # 3 bytes per pixel (RGB)
+    file_size = len(buffer)
     
-    with open(file_path, 'rb') as f:
-        # Skip header (16 bytes) and previous frames
-        offset = 16 + frame_index * frame_size
-        f.seek(offset)
-        frame_data = f.read(frame_size)
-        
-        if len(frame_data) != frame_size:
-            raise ValueError(f"Could not read complete frame {frame_index}. Expected {frame_size} bytes, got {len(frame_data)} bytes")
-        
-        # Convert bytes to RGB matrix
-        matrix = []
-        byte_idx = 0
-        
-        for y in range(height):
-            row = []
-            for x in range(width):
-                r = frame_data[byte_idx]
-                g = frame_data[byte_idx + 1]
-                b = frame_data[byte_idx + 2]
-                row.append([r, g, b])
-                byte_idx += 3
-            matrix.append(row)
-        
-        return matrix
+    # Skip header (16 bytes) and previous frames
+    offset = 16 + frame_index * frame_size
+    
+    # Check if we have enough data
+    if offset + frame_size > file_size - 16:  # account for trailer
+        raise ValueError(f"Frame {frame_index} would read beyond file size. Offset: {offset}, Frame size: {frame_size}, File size: {file_size}")
+    
+    return np.frombuffer(buffer, dtype=np.uint8, count=frame_size, offset=offset).reshape(height, width, 3)
 
 
-def matrix_to_image(matrix: List[List[List[int]]]) -> Image.Image:
+def matrix_to_image(matrix: np.ndarray) -> Image.Image:
     """
     Convert RGB matrix to PIL Image.
     
     Args:
-        matrix: RGB matrix
+        matrix: (height, width, 3) RGB matrix (ndarray or nested lists)
         
     Returns:
         PIL Image object
     """
-    height = len(matrix)
-    width = len(matrix[0])
-    
-    # Create numpy array for easier manipulation
-    np_array = np.zeros((height, width, 3), dtype=np.uint8)
-    
-    for y in range(height):
-        for x in range(width):
-            np_array[y, x] = matrix[y][x]
-    
-    return Image.fromarray(np_array, 'RGB')
+    matrix = np.ascontiguousarray(matrix, dtype=np.uint8)  # no copy for frame views
+    height, width = matrix.shape[:2]
+    # PIL reads the packed RGB rows straight from the buffer
+    return Image.frombuffer('RGB', (width, height), matrix, 'raw', 'RGB', 0, 1)
 
 
 def debug_bin_file(file_path: str):
@@ -189,7 +223,7 @@ def debug_bin_file(file_path: str):
         header_data = f.read(16)
         
         print(f"\nTrying different header interpretations:")
-        print(f"As IIII (little-endian): {struct.unpack('<IIII', header_data)}")
+        print(f"As IIII (little-endian): {_HDR.unpack(header_data)}")
         print(f"As IIII (big-endian): {struct.unpack('>IIII', header_data)}")
         
         # Check what the actual image size might be based on file size
@@ -199,15 +233,19 @@ def debug_bin_file(file_path: str):
         print(f"\nPossible image dimensions (assuming 1 frame):")
         for possible_pixels in [remaining_size // 3]:  # RGB = 3 bytes per pixel
             if possible_pixels > 0:
-                # Try common aspect ratios
-                import math
-                sqrt_pixels = int(math.sqrt(possible_pixels))
-                for width in range(max(1, sqrt_pixels - 100), sqrt_pixels + 100):
-                    if possible_pixels % width == 0:
-                        height = possible_pixels // width
-                        print(f"  {width}x{height} pixels ({width*height*3} bytes)")
-                        if width == height:  # square image
-                            print(f"    ^ Square image: {width}x{width}")
+                # Enumerate every divisor pair once, keeping common aspect ratios
+                shapes = []
+                for short_side in range(1, math.isqrt(possible_pixels) + 1):
+                    if possible_pixels % short_side == 0:
+                        long_side = possible_pixels // short_side
+                        if long_side <= short_side * MAX_DEBUG_ASPECT:
+                            shapes.append((short_side, long_side))
+                            if long_side != short_side:
+                                shapes.append((long_side, short_side))
+                for width, height in sorted(shapes):
+                    print(f"  {width}x{height} pixels ({width*height*3} bytes)")
+                    if width == height:  # square image
+                        print(f"    ^ Square image: {width}x{width}")
 
 
 def test_bin_file(file_path: str, output_dir: str = "./test_output"):
@@ -225,8 +263,11 @@ def test_bin_file(file_path: str, output_dir: str = "./test_output"):
     os.makedirs(output_dir, exist_ok=True)
     
     try:
+        # Map the file once; header, trailer and frames are all read from the mapping
+        mm = map_bin_file(file_path)
+        
         # Read header
-        total_frames, height, width, fps = read_bin_header(file_path)
+        total_frames, height, width, fps = unpack_bin_header(mm)
         print(f"Header Information:")
         print(f"  Total Frames: {total_frames}")
         print(f"  Dimensions: {width} x {height}")
@@ -236,7 +277,7 @@ def test_bin_file(file_path: str, output_dir: str = "./test_output"):
         # Calculate file size expectations
         frame_size = height * width * 3
         expected_size = 16 + (total_frames * frame_size) + 16  # header + frames + trailer
-        actual_size = os.path.getsize(file_path)
+        actual_size = len(mm)
         
         print(f"\nFile Size Check:")
         print(f"  Expected: {expected_size:,} bytes")
@@ -252,11 +293,15 @@ def test_bin_file(file_path: str, output_dir: str = "./test_output"):
         print(f"  File size indicates: {actual_frames} frames")
         print(f"  Using: {min(total_frames, actual_frames)} frames for extraction")
         
-        effective_frames = min(total_frames, actual_frames)
+        effective_frames = max(0, min(total_frames, actual_frames))
+        
+        # One (frames, height, width, 3) view over all complete frames
+        frames = np.frombuffer(mm, dtype=np.uint8, count=effective_frames * frame_size,
+                               offset=16).reshape(effective_frames, height, width, 3)
         
         # Read trailer
         frame_data_size = total_frames * frame_size
-        total_frames_check, save_time, end_marker = read_bin_trailer(file_path, frame_data_size)
+        total_frames_check, save_time, end_marker = unpack_bin_trailer(mm, frame_data_size)
         
         print(f"\nTrailer Information:")
         print(f"  Total Frames Check: {total_frames_check}")
@@ -270,11 +315,15 @@ def test_bin_file(file_path: str, output_dir: str = "./test_output"):
         sample_indices = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15]
         sample_indices = list(set(sample_indices))  # Remove duplicates
         
+        # Check only the sampled frames for black (delay) frames, in one kernel call
+        present_indices = [idx for idx in sample_indices if idx < effective_frames]
+        black_flags = dict(zip(present_indices, find_black_frames(frames[present_indices])))
+        
         for idx in sample_indices:
             if idx < effective_frames:
                 try:
                     print(f"  Extracting frame {idx}...")
-                    matrix = safe_read_frame_data(file_path, idx, height, width)
+                    matrix = frames[idx]
                     image = matrix_to_image(matrix)
                     
                     output_path = os.path.join(output_dir, f"frame_{idx:06d}.png")
@@ -282,24 +331,14 @@ def test_bin_file(file_path: str, output_dir: str = "./test_output"):
                     print(f"    Saved: {output_path}")
                     
                     # Check if frame is all black (delay frame)
-                    is_black = all(
-                        all(all(pixel == [0, 0, 0] for pixel in row) for row in matrix)
-                        for row in matrix
-                    )
-                    if is_black:
+                    if black_flags[idx]:
                         print(f"    Note: Frame {idx} is a black (delay) frame")
                         
                 except Exception as e:
                     print(f"    Error extracting frame {idx}: {e}")
                     # Try to extract what we can
-                    try:
-                        with open(file_path, 'rb') as f:
-                            offset = 16 + idx * (height * width * 3)
-                            f.seek(offset)
-                            available_data = f.read()
-                            print(f"    Available data from offset {offset}: {len(available_data)} bytes")
-                    except:
-                        pass
+                    offset = 16 + idx * (height * width * 3)
+                    print(f"    Available data from offset {offset}: {max(0, len(mm) - offset)} bytes")
         
         print(f"\n{'✓' if expected_size == actual_size and total_frames == total_frames_check and end_marker == 0xDEADBEEF else '✗'} Binary file test completed!")
         
@@ -307,6 +346,41 @@ def test_bin_file(file_path: str, output_dir: str = "./test_output"):
         print(f"Error testing binary file: {e}")
 
 
+def list_original_images(directory: str) -> List[str]:
+    """
+    List the original image files in a directory (unfiltered, unsorted).
+    
+    Args:
+        directory: Directory containing original images
+        
+    Returns:
+        List of image file paths
+    """
+    # One directory pass; hidden files are skipped as glob would
+    with os.scandir(directory) as it:
+        return [
+            entry.path for entry in it
+            if not entry.name.startswith('.') and entry.is_file()
+            and entry.name.lower().endswith(ORIGINAL_IMAGE_EXTENSIONS)
+        ]
+
+
+def load_original_image(file_path: str, width: int, height: int) -> Image.Image:
+    """
+    Load an original image as RGB, resized to the bin frame size.
+    
+    Args:
+        file_path: Path to the image file
+        width: Frame width
+        height: Frame height
+        
+    Returns:
+        RGB PIL Image of size (width, height)
+    """
+    with Image.open(file_path) as img:
+        return img.convert("RGB").resize((width, height))  # Ensure same size
+
+
 def compare_with_original_images(bin_file: str, original_dir: str, output_dir: str = "./comparison_output"):
     """
     Compare extracted frames with original images.
@@ -323,9 +397,7 @@ def compare_with_original_images(bin_file: str, original_dir: str, output_dir: s
     
     try:
         # Get original image files (excluding visualization files)
-        image_files = []
-        for ext in ['*.png', '*.jpg', '*.jpeg']:
-            image_files.extend(glob.glob(os.path.join(original_dir, ext)))
+        image_files = list_original_images(original_dir)
         
         # Filter out visualization and other non-animation files
         filtered_files = []
@@ -355,30 +427,32 @@ def compare_with_original_images(bin_file: str, original_dir: str, output_dir: s
             return
         
         # Read bin file header
-        total_frames, height, width, fps = read_bin_header(bin_file)
+        mm = map_bin_file(bin_file)
+        total_frames, height, width, fps = unpack_bin_header(mm)
+        combo = np.empty((height, width * 2, 3), dtype=np.uint8)
         
         # Compare first few frames with original images
-        for i in range(min(len(image_files), 10)):  # Compare first 10 images
-            print(f"Comparing frame {i} with {os.path.basename(image_files[i])}...")
-            
-            # Extract frame from bin
-            matrix = safe_read_frame_data(bin_file, i, height, width)
-            extracted_img = matrix_to_image(matrix)
-            
-            # Load original image
-            original_img = Image.open(image_files[i]).convert("RGB")
-            original_img = original_img.resize((width, height))  # Ensure same size
-            
-            # Save comparison
-            comparison_path = os.path.join(output_dir, f"comparison_{i:03d}.png")
-            
-            # Create side-by-side comparison
-            comparison_img = Image.new('RGB', (width * 2, height))
-            comparison_img.paste(original_img, (0, 0))
-            comparison_img.paste(extracted_img, (width, 0))
-            comparison_img.save(comparison_path)
+        compare_files = image_files[:10]  # Compare first 10 images
+        
+        # Decode and resize the originals concurrently; Pillow releases the GIL while doing so
+        with ThreadPoolExecutor() as executor:
+            originals = executor.map(lambda path: load_original_image(path, width, height), compare_files)
             
-            print(f"  Saved comparison: {comparison_path}")
+            for i, original_img in enumerate(originals):
+                print(f"Comparing frame {i} with {os.path.basename(compare_files[i])}...")
+                
+                # Extract frame from bin
+                matrix = frame_view(mm, i, height, width)
+                
+                # Save comparison
+                comparison_path = os.path.join(output_dir, f"comparison_{i:03d}.png")
+                
+                # Create side-by-side comparison: original on the left, extracted on the right
+                combo[:, :width] = np.asarray(original_img)
+                combo[:, width:] = matrix
+                Image.fromarray(combo).save(comparison_path)
+                
+                print(f"  Saved comparison: {comparison_path}")
         
     except Exception as e:
         print(f"Error in comparison: {e}")
@@ -418,10 +492,7 @@ if __name__ == "__main__":
         # Also check original image sizes
         if os.path.exists(args.original_dir):
             print(f"\nChecking original image sizes from: {args.original_dir}")
-            image_files = []
-            for ext in ['*.png', '*.jpg', '*.jpeg']:
-                image_files.extend(glob.glob(os.path.join(args.original_dir, ext)))
-            image_files = sorted(image_files, key=natural_sort_key)
+            image_files = sorted(list_original_images(args.original_dir), key=natural_sort_key)
             
             if image_files:
                 sample_img = Image.open(image_files[0])
@@ -1,7 +1,7 @@
 import struct
+import mmap
 import sys
 import os
-import time
 import argparse
 from typing import List
 import cv2
@@ -9,6 +9,9 @@ import numpy as np
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
+# Precompiled header layout: total_frames, height, width, fps
+_HDR = struct.Struct('<IIII')
+
 
 def read_bin_header(file_path: str):
     """
@@ -21,50 +24,118 @@ def read_bin_header(file_path: str):
         Tuple of (total_frames, height, width, fps)
     """
     with open(file_path, 'rb') as f:
-        header_data = f.read(16)  # 4 * 4 bytes = 16 bytes
-        if len(header_data) != 16:
-            raise ValueError("Could not read complete header")
-        total_frames, height, width, fps = struct.unpack('<IIII', header_data)
-        return total_frames, height, width, fps
+        return unpack_bin_header(f.read(_HDR.size))
+
+
+def unpack_bin_header(buffer):
+    """
+    Parse the header from the start of a binary file buffer.
+    
+    Args:
+        buffer: bytes-like object or mmap holding the file contents
+        
+    Returns:
+        Tuple of (total_frames, height, width, fps)
+    """
+    if len(buffer) < _HDR.size:
+        raise ValueError("Could not read complete header")
+    return _HDR.unpack_from(buffer, 0)
 
 
-def read_frame_data(file_path: str, frame_index: int, height: int, width: int):
+def map_bin_file(file_path: str) -> mmap.mmap:
     """
-    Read a specific frame from the binary file.
+    Map a binary file read-only.
+    
+    The mapping stays valid after the file is closed and is released once it
+    and every frame view into it are no longer referenced.
     
     Args:
         file_path: Path to the binary file
-        frame_index: Index of the frame to read (0-based)
+        
+    Returns:
+        Read-only mmap of the whole file
+    """
+    with open(file_path, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def count_effective_frames(total_frames: int, height: int, width: int, file_size: int) -> int:
+    """
+    Count the frames that are both declared in the header and fully present in the file.
+    
+    Args:
+        total_frames: Frame count from the header
         height: Height of the frame
         width: Width of the frame
+        file_size: Size of the binary file in bytes
         
     Returns:
-        RGB matrix for the frame
+        Number of playable frames
     """
-    frame_size = height * width * 3  # 3 bytes per pixel (RGB)
+    actual_frame_data_size = file_size - 32  # subtract header and trailer
+    actual_frames = actual_frame_data_size // (height * width * 3)
+    return min(total_frames, actual_frames)
+
+
+def frame_array_view(buffer, frame_count: int, height: int, width: int) -> np.ndarray:
+    """
+    View the frames of a mapped binary file as one array, without copying.
     
-    with open(file_path, 'rb') as f:
-        # Skip header (16 bytes) and previous frames
-        offset = 16 + frame_index * frame_size
-        f.seek(offset)
-        frame_data = f.read(frame_size)
-        
-        if len(frame_data) != frame_size:
-            # Check if we've reached the end of available data
-            file_size = os.path.getsize(file_path)
-            available_frames = (file_size - 32) // frame_size  # subtract header + trailer
-            if frame_index >= available_frames:
-                return None  # No more frames available
-            raise ValueError(f"Could not read complete frame {frame_index}")
+    Args:
+        buffer: mmap (or bytes) holding the whole binary file
+        frame_count: Number of complete frames to expose
+        height: Height of the frame
+        width: Width of the frame
         
-        # Convert bytes to numpy array (RGB)
-        frame_array = np.frombuffer(frame_data, dtype=np.uint8)
-        frame_array = frame_array.reshape((height, width, 3))
+    Returns:
+        Read-only (frame_count, height, width, 3) uint8 RGB view
+    """
+    frame_size = height * width * 3  # 3 bytes per pixel (RGB)
+    # Skip header (16 bytes)
+    frames = np.frombuffer(buffer, dtype=np.uint8, count=frame_count * frame_size, offset=16)
+    return frames.reshape((frame_count, height, width, 3))
+
+
+def read_frame_data(frames: np.ndarray, frame_index: int, out: np.ndarray = None):
+    """
+    Read a specific frame from the frame view as BGR.
+    
+    Args:
+        frames: (N, height, width, 3) RGB frame view from frame_array_view
+        frame_index: Index of the frame to read (0-based)
+        out: Optional preallocated (height, width, 3) uint8 array for the BGR result
         
-        # Convert RGB to BGR for OpenCV
-        frame_bgr = cv2.cvtColor(frame_array, cv2.COLOR_RGB2BGR)
+    Returns:
+        BGR matrix for the frame, or None past the last frame
+    """
+    if frame_index >= len(frames):
+        return None  # No more frames available
+    
+    # Convert RGB to BGR for OpenCV by reversing the channel axis
+    frame_array = frames[frame_index]
+    if out is None:
+        return np.ascontiguousarray(frame_array[..., ::-1])
+    np.copyto(out, frame_array[..., ::-1])
+    return out
+
+
+def scale_frame(frame: np.ndarray, scale_factor: int, out: np.ndarray = None) -> np.ndarray:
+    """
+    Scale a frame up by an integer factor with nearest-neighbour interpolation.
+    
+    Args:
+        frame: BGR frame to scale
+        scale_factor: Factor to scale up the image
+        out: Optional preallocated destination of the scaled size
         
-        return frame_bgr
+    Returns:
+        Scaled frame (the input frame itself when scale_factor <= 1)
+    """
+    if scale_factor <= 1:
+        return frame
+    height, width = frame.shape[:2]
+    return cv2.resize(frame, (width * scale_factor, height * scale_factor),
+                      dst=out, interpolation=cv2.INTER_NEAREST)
 
 
 def play_bin_file(file_path: str, scale_factor: int = 20, loop: bool = True):
@@ -81,21 +152,28 @@ def play_bin_file(file_path: str, scale_factor: int = 20, loop: bool = True):
     print("Press 'q' to quit, 'space' to pause/resume")
     
     try:
+        # Map the file once; the header and frames are read from the mapping
+        mm = map_bin_file(file_path)
+        
+        # Ask the kernel to read the frames ahead in the background while we display
+        if hasattr(mmap, 'MADV_WILLNEED'):  # not available on Windows
+            mm.madvise(mmap.MADV_WILLNEED)
+        
         # Read header
-        total_frames, height, width, fps = read_bin_header(file_path)
+        total_frames, height, width, fps = unpack_bin_header(mm)
         print(f"Video info: {total_frames} frames, {width}x{height} pixels, {fps} FPS")
         
         # Calculate actual frames based on file size
-        file_size = os.path.getsize(file_path)
-        actual_frame_data_size = file_size - 32  # subtract header and trailer
-        actual_frames = actual_frame_data_size // (height * width * 3)
-        effective_frames = min(total_frames, actual_frames)
+        effective_frames = count_effective_frames(total_frames, height, width, len(mm))
         
         if effective_frames != total_frames:
             print(f"Warning: Header says {total_frames} frames, but file only contains {effective_frames} frames")
         
-        # Calculate frame delay for target FPS
-        frame_delay = 0.2
+        # One view over all complete frames; each displayed frame is just an index into it
+        frames = frame_array_view(mm, max(0, effective_frames), height, width)
+        
+        # Calculate frame delay for target FPS (waitKey blocks for it between frames)
+        frame_delay_ms = max(1, int(1000 / fps)) if fps > 0 else 200
         
         # Calculate display size
         display_width = width * scale_factor
@@ -108,17 +186,18 @@ def play_bin_file(file_path: str, scale_factor: int = 20, loop: bool = True):
         
         print(f"Display size: {display_width}x{display_height} (original: {width}x{height})")
         
+        # Reused conversion and scaling buffers, so the display loop does not allocate per frame
+        bgr_buf = np.empty((height, width, 3), dtype=np.uint8)
+        scaled_buf = np.empty((display_height, display_width, 3), dtype=np.uint8) if scale_factor > 1 else None
+        
         frame_index = 0
         paused = False
-        last_frame_time = time.time()
         
         while True:
-            current_time = time.time()
-            
-            # Only advance frame if not paused and enough time has passed
-            if not paused and (current_time - last_frame_time) >= frame_delay:
+            # Only advance frame if not paused
+            if not paused:
                 # Read current frame
-                frame = read_frame_data(file_path, frame_index, height, width)
+                frame = read_frame_data(frames, frame_index, bgr_buf)
                 
                 if frame is None:
                     if loop:
@@ -128,22 +207,16 @@ def play_bin_file(file_path: str, scale_factor: int = 20, loop: bool = True):
                         break  # End of video
                 
                 # Scale up the frame
-                if scale_factor > 1:
-                    scaled_frame = cv2.resize(frame, 
-                                            (width * scale_factor, height * scale_factor), 
-                                            interpolation=cv2.INTER_NEAREST)
-                else:
-                    scaled_frame = frame
+                scaled_frame = scale_frame(frame, scale_factor, scaled_buf)
                 
                 # Display frame
                 cv2.imshow('Bin File Player', scaled_frame)
                 
                 # Move to next frame
                 frame_index = (frame_index + 1) % effective_frames
-                last_frame_time = current_time
             
-            # Handle keyboard input
-            key = cv2.waitKey(1) & 0xFF
+            # Handle keyboard input; wait one frame period, or until a key press while paused
+            key = cv2.waitKey(0 if paused else frame_delay_ms) & 0xFF
             
             if key == ord('q') or key == 27:  # 'q' or ESC to quit
                 break
@@ -153,21 +226,15 @@ def play_bin_file(file_path: str, scale_factor: int = 20, loop: bool = True):
                     print("Paused - Press space to resume")
                 else:
                     print("Resumed")
-                    last_frame_time = time.time()  # Reset timing when resuming
             elif key == ord('r'):  # 'r' to restart
                 frame_index = 0
                 print("Restarted")
             elif key == ord('s'):  # 's' to step frame by frame (when paused)
                 if paused:
                     frame_index = (frame_index + 1) % effective_frames
-                    frame = read_frame_data(file_path, frame_index, height, width)
+                    frame = read_frame_data(frames, frame_index, bgr_buf)
                     if frame is not None:
-                        if scale_factor > 1:
-                            scaled_frame = cv2.resize(frame, 
-                                                    (width * scale_factor, height * scale_factor), 
-                                                    interpolation=cv2.INTER_NEAREST)
-                        else:
-                            scaled_frame = frame
+                        scaled_frame = scale_frame(frame, scale_factor, scaled_buf)
                         cv2.imshow('Bin File Player', scaled_frame)
                         print(f"Frame: {frame_index}/{effective_frames}")
         
@@ -187,13 +254,12 @@ def get_video_info(file_path: str):
         file_path: Path to the binary file
     """
     try:
-        total_frames, height, width, fps = read_bin_header(file_path)
-        file_size = os.path.getsize(file_path)
+        mm = map_bin_file(file_path)
+        total_frames, height, width, fps = unpack_bin_header(mm)
+        file_size = len(mm)
         
         # Calculate actual frames
-        actual_frame_data_size = file_size - 32
-        actual_frames = actual_frame_data_size // (height * width * 3)
-        effective_frames = min(total_frames, actual_frames)
+        effective_frames = count_effective_frames(total_frames, height, width, file_size)
         
         duration = effective_frames / fps if fps > 0 else 0
         
@@ -1,32 +1,83 @@
+import io
 import struct
 import time
-from typing import List
+from typing import BinaryIO, List
+from itertools import groupby
+from collections import OrderedDict
+import numpy as np
 
-def flatten_rgb_matrix(matrix: List[List[List[int]]]) -> List[int]:
-    return [value for row in matrix for pixel in row for value in pixel]
+# Precompiled header/trailer layouts (16 bytes each)
+_HDR = struct.Struct('<IIII')  # total_frames, height, width, fps
+_TRL = struct.Struct('<IQI')   # total_frames, save_time, end_marker
+
+# Encoded bytes kept for the most recently written distinct frames (enough for blink patterns)
+_RECENT_FRAMES = 8
+
+
+def to_uint8(frames) -> np.ndarray:
+    # uint8 data passes through untouched; anything else is range-checked before
+    # the cast (which would silently wrap 300 -> 44, -1 -> 255, 1.7 -> 1)
+    array = np.asarray(frames)
+    if array.dtype != np.uint8:
+        if array.dtype.kind not in 'biu' or (array.size and (array.min() < 0 or array.max() > 255)):
+            raise ValueError("Pixel values must be integers in range(0, 256)")
+        array = array.astype(np.uint8)
+    return array
+
+
+def encode_frame(frame) -> bytes:
+    return to_uint8(frame).tobytes()
 
 
 def add_header(total_frames: int, height: int, width: int, fps: int) -> bytes:
-    return struct.pack('<IIII', total_frames, height, width, fps)
+    return _HDR.pack(total_frames, height, width, fps)
 
 
 def add_trailer(total_frames: int, end_marker: int = 0xDEADBEEF) -> bytes:
     save_time = int(time.time())
-    return struct.pack('<IQI', total_frames, save_time, end_marker)
+    return _TRL.pack(total_frames, save_time, end_marker)
 
 
-def add_metadata(rgb_matrices: List[List[List[List[int]]]], fps: int = 1) -> bytes:
-    if not rgb_matrices:
+def write_metadata(f: BinaryIO, rgb_matrices: List[List[List[List[int]]]], fps: int = 1):
+    if len(rgb_matrices) == 0:
         raise ValueError("No frame data provided.")
 
-    total_frames = len(rgb_matrices)
-    height = len(rgb_matrices[0])
-    width = len(rgb_matrices[0][0])
+    if isinstance(rgb_matrices, np.ndarray):
+        # Whole (N, H, W, 3) array: write the payload straight from its buffer
+        frame_array = np.ascontiguousarray(to_uint8(rgb_matrices))
+        total_frames, height, width = frame_array.shape[:3]
+        f.write(add_header(total_frames, height, width, fps))
+        try:
+            f.fileno()
+        except (AttributeError, io.UnsupportedOperation):
+            f.write(frame_array.data)  # in-memory stream, e.g. add_metadata's BytesIO
+        else:
+            frame_array.tofile(f)  # real file: written from the array buffer by NumPy
+    else:
+        total_frames = len(rgb_matrices)
+        height = len(rgb_matrices[0])
+        width = len(rgb_matrices[0][0])
+        f.write(add_header(total_frames, height, width, fps))
+        # Each run of one frame object (e.g. [frame] * n) is encoded once, and the last
+        # few distinct frames are kept so a repeating blink pattern reuses them;
+        # the list keeps the frames alive, so id() is stable
+        recent = OrderedDict()
+        for frame_id, run in groupby(rgb_matrices, key=id):
+            frame = next(run)
+            repeat = 1 + sum(1 for _ in run)
+            frame_bytes = recent.pop(frame_id, None)
+            if frame_bytes is None:
+                frame_bytes = encode_frame(frame)
+                if len(recent) >= _RECENT_FRAMES:
+                    recent.popitem(last=False)
+            recent[frame_id] = frame_bytes
+            for _ in range(repeat):
+                f.write(frame_bytes)
 
-    header = add_header(total_frames, height, width, fps)
-    frames = b''.join(
-        bytes(flatten_rgb_matrix(frame)) for frame in rgb_matrices
-    )
-    trailer = add_trailer(total_frames)
+    f.write(add_trailer(total_frames))
 
-    return header + frames + trailer
\ No newline at end of file
+
+def add_metadata(rgb_matrices: List[List[List[List[int]]]], fps: int = 1) -> bytes:
+    buffer = io.BytesIO()
+    write_metadata(buffer, rgb_matrices, fps)
+    return buffer.getvalue()
@@ -1,21 +1,123 @@
 from typing import List
 import sys
 import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
-from src.utils.add_metadata import add_metadata
+import numpy as np
+_ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if _ROOT_DIR not in sys.path:
+    sys.path.append(_ROOT_DIR)
+from src.utils.add_metadata import write_metadata, add_header, add_trailer, to_uint8
 
 def bin_maker(frames: List[List[List[List[int]]]], output_path: str, fps: int = 1):
     """
     Create a binary file from RGB matrices.
     
     Args:
-        frames: List of RGB matrices (frames)
+        frames: List of RGB matrices (frames), or an (N, H, W, 3) uint8 array
         output_path: Path to save the output binary file
         fps: Frames per second
     """
-    bin_data = add_metadata(frames, fps=fps)
+    if len(frames) == 0:
+        raise ValueError("No frame data provided.")
 
-    with open(output_path, 'wb') as f:
-        f.write(bin_data)
+    # Stream header, frames and trailer instead of building the whole file in memory
+    try:
+        with open(output_path, 'wb', buffering=1 << 20) as f:
+            write_metadata(f, frames, fps=fps)
+    except BaseException:
+        # A frame failed to encode after the header was written: don't leave a truncated file
+        try:
+            os.remove(output_path)
+        except OSError:
+            pass
+        raise
 
-    print(f"[✔] Saved {len(frames)} frame(s) to: {output_path}")
\ No newline at end of file
+    print(f"[✔] Saved {len(frames)} frame(s) to: {output_path}")
+
+
+class BinWriter:
+    """
+    Stream frames to a binary file one at a time.
+    
+    The header is written with a placeholder frame count and patched on
+    close(), so only the current frame has to be held in memory. Used as a
+    context manager, a write that fails part-way removes the partial file.
+    """
+
+    def __init__(self, output_path: str, fps: int = 1):
+        """
+        Args:
+            output_path: Path to save the output binary file
+            fps: Frames per second
+        """
+        self.output_path = output_path
+        self.fps = fps
+        self.frame_count = 0
+        self._file = None
+        self._shape = None
+
+    def write_frame(self, frame: np.ndarray):
+        """
+        Append one (H, W, 3) RGB frame.
+        
+        Args:
+            frame: RGB frame as a uint8 array
+        """
+        frame = np.ascontiguousarray(to_uint8(frame))
+        if self._file is None:
+            self._shape = frame.shape
+            self._file = open(self.output_path, 'wb')
+            self._file.write(add_header(0, frame.shape[0], frame.shape[1], self.fps))
+        elif frame.shape != self._shape:
+            raise ValueError(f"Frame shape {frame.shape} does not match {self._shape}")
+
+        self._file.write(frame.data)
+        self.frame_count += 1
+
+    def write_frames(self, frames: np.ndarray):
+        """
+        Append a block of (N, H, W, 3) RGB frames in a single write.
+        
+        Args:
+            frames: RGB frames as a uint8 array
+        """
+        frames = np.ascontiguousarray(to_uint8(frames))
+        if len(frames) == 0:
+            return
+        if self._file is None:
+            self.write_frame(frames[0])
+            frames = frames[1:]
+        elif frames.shape[1:] != self._shape:
+            raise ValueError(f"Frame shape {frames.shape[1:]} does not match {self._shape}")
+
+        self._file.write(frames.data)
+        self.frame_count += len(frames)
+
+    def close(self):
+        """
+        Write the trailer, patch the header frame count and close the file.
+        """
+        if self._file is None:
+            raise ValueError("No frame data provided.")
+
+        self._file.write(add_trailer(self.frame_count))
+        self._file.seek(0)
+        self._file.write(add_header(self.frame_count, self._shape[0], self._shape[1], self.fps))
+        self._file.close()
+        self._file = None
+
+        print(f"[✔] Saved {self.frame_count} frame(s) to: {self.output_path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        elif self._file is not None:
+            # Don't leave a truncated file with a zero frame count behind
+            self._file.close()
+            self._file = None
+            try:
+                os.remove(self.output_path)
+            except OSError:
+                pass
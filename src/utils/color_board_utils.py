@@ -1,7 +1,77 @@
 from typing import List, Tuple
-import colorsys
+from functools import lru_cache
+import numpy as np
 
-def create_color_frame(r: int, g: int, b: int, width: int = 12, height: int = 12) -> List[List[List[int]]]:
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; frames are then painted with NumPy
+    njit = None
+    prange = range
+
+
+def _paint_frames(out: np.ndarray, frame_colors: np.ndarray, lit_pixels: np.ndarray):
+    """
+    Paint each zero-initialised frame of out in parallel over the frame axis.
+    
+    Args:
+        out: (N, H, W, 3) uint8 output buffer, all zeros
+        frame_colors: (N, 3) uint8 color per frame
+        lit_pixels: (N,) row-major pixel index to light, or -1 to fill the whole frame
+    """
+    height = out.shape[1]
+    width = out.shape[2]
+    for k in prange(out.shape[0]):
+        r = frame_colors[k, 0]
+        g = frame_colors[k, 1]
+        b = frame_colors[k, 2]
+        if r == 0 and g == 0 and b == 0:
+            continue  # 꺼진 프레임은 이미 0
+        pixel = lit_pixels[k]
+        if pixel >= 0:
+            row = pixel // width
+            col = pixel % width
+            out[k, row, col, 0] = r
+            out[k, row, col, 1] = g
+            out[k, row, col, 2] = b
+        else:
+            for row in range(height):
+                for col in range(width):
+                    out[k, row, col, 0] = r
+                    out[k, row, col, 1] = g
+                    out[k, row, col, 2] = b
+
+
+if njit is not None:
+    _paint_frames = njit(cache=True, parallel=True)(_paint_frames)
+
+
+def paint_frames(frame_colors: np.ndarray, lit_pixels: np.ndarray, width: int, height: int) -> np.ndarray:
+    """
+    Render frames that are either fully filled with one color or have a single lit pixel.
+    
+    Args:
+        frame_colors: (N, 3) color per frame (black frames stay off)
+        lit_pixels: (N,) row-major pixel index to light, or -1 to fill the whole frame
+        width: Board width
+        height: Board height
+        
+    Returns:
+        uint8 array of shape (N, height, width, 3)
+    """
+    frame_colors = np.ascontiguousarray(frame_colors, dtype=np.uint8)
+    lit_pixels = np.ascontiguousarray(lit_pixels, dtype=np.int64)
+    out = np.zeros((len(frame_colors), height, width, 3), dtype=np.uint8)
+    if njit is not None:
+        _paint_frames(out, frame_colors, lit_pixels)
+        return out
+    # numba 가 없으면 같은 계산을 NumPy 로 한 번에
+    full = lit_pixels < 0
+    out[full] = frame_colors[full][:, None, None, :]
+    single = np.flatnonzero(~full)
+    out[single, lit_pixels[single] // width, lit_pixels[single] % width] = frame_colors[single]
+    return out
+
+def create_color_frame(r: int, g: int, b: int, width: int = 12, height: int = 12) -> np.ndarray:
     """
     Create a single color frame of given size.
     
@@ -11,9 +81,18 @@ def create_color_frame(r: int, g: int, b: int, width: int = 12, height: int = 12
         height: height of the frame (default: 12)
         
     Returns:
-        3D list representing the RGB matrix [height][width][3]
+        uint8 array of shape (height, width, 3)
+    """
+    return np.full((height, width, 3), (r, g, b), dtype=np.uint8)
+
+@lru_cache(maxsize=64)
+def _shared_color_frame(r: int, g: int, b: int, width: int, height: int) -> np.ndarray:
     """
-    return [[[r, g, b] for _ in range(width)] for _ in range(height)]
+    Read-only color frame shared by every generator that asks for the same color and size.
+    """
+    frame = create_color_frame(r, g, b, width, height)
+    frame.flags.writeable = False
+    return frame
 
 def create_blinking_color_frames(
     colors: List[Tuple[int, int, int]], 
@@ -21,7 +100,7 @@ def create_blinking_color_frames(
     height: int = 12,
     frames_per_color: int = 5,
     repeat: int = 100
-) -> List[List[List[List[int]]]]:
+) -> List[np.ndarray]:
     """
     Create a sequence of blinking color frames.
     
@@ -33,15 +112,13 @@ def create_blinking_color_frames(
         repeat: How many times to repeat the sequence (default: 1)
         
     Returns:
-        List of frames for blinking animation
+        List of frames for blinking animation (frames of one color share one read-only array)
     """
+    color_frames = [_shared_color_frame(r, g, b, width, height) for r, g, b in colors]
     frames = []
     for _ in range(repeat):
-        for color in colors:
-            r, g, b = color
-            frame = create_color_frame(r, g, b, width, height)
-            for _ in range(frames_per_color):
-                frames.append(frame)
+        for frame in color_frames:
+            frames.extend([frame] * frames_per_color)
     return frames
 
 def create_solid_color_frames(
@@ -49,7 +126,7 @@ def create_solid_color_frames(
     width: int = 12,
     height: int = 12,
     frame_count: int = 50
-) -> List[List[List[List[int]]]]:
+) -> List[np.ndarray]:
     """
     Create frames of a single solid color.
     
@@ -60,13 +137,9 @@ def create_solid_color_frames(
         frame_count: Number of frames to create (default: 50)
         
     Returns:
-        List of frames with the same color
+        List of frames with the same color (all sharing one read-only array)
     """
-    frames = []
-    frame = create_color_frame(r, g, b, width, height)
-    for _ in range(frame_count):
-        frames.append(frame)
-    return frames
+    return [_shared_color_frame(r, g, b, width, height)] * frame_count
 
 def validate_rgb(r: int, g: int, b: int) -> bool:
     """
@@ -81,35 +154,43 @@ def validate_rgb(r: int, g: int, b: int) -> bool:
     return 0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255
 
 
-def create_rainbow_colors(steps: int) -> List[Tuple[int, int, int]]:
+# 색상환 구간(60°)별 R, G, B 채널이 쓰는 값: 0 = v, 1 = q, 2 = t, 3 = p
+_HSV_SEXTANT_LEVELS = np.array([
+    [0, 2, 3],
+    [1, 0, 3],
+    [3, 0, 2],
+    [3, 1, 0],
+    [2, 3, 0],
+    [0, 3, 1],
+])
+
+
+@lru_cache(maxsize=32)
+def create_rainbow_colors(steps: int) -> Tuple[Tuple[int, int, int], ...]:
     """
     Create a beautiful rainbow color sequence from red to violet.
     
+    The result is cached per step count, so it is returned as an immutable tuple.
+    
     Args:
         steps: Number of color steps in the rainbow
         
     Returns:
-        List of RGB tuples representing rainbow colors
+        Tuple of RGB tuples representing rainbow colors
     """
-    colors = []
-    for i in range(steps):
-        # HSV에서 H값을 0 (빨강)부터 300 (보라)까지 변화
-        # 색상환에서 빨강(0°) → 주황(30°) → 노랑(60°) → 초록(120°) → 파랑(240°) → 보라(300°)
-        hue = (i / steps) * 300 / 360  # 0~300도를 0~1 범위로 변환
-        saturation = 1.0  # 채도는 최대
-        value = 1.0  # 명도도 최대
-        
-        # HSV를 RGB로 변환
-        rgb = colorsys.hsv_to_rgb(hue, saturation, value)
-        
-        # 0-1 범위를 0-255 범위로 변환
-        r = int(round(rgb[0] * 255))
-        g = int(round(rgb[1] * 255))
-        b = int(round(rgb[2] * 255))
-        
-        colors.append((r, g, b))
+    # HSV에서 H값을 0 (빨강)부터 300 (보라)까지 변화
+    # 색상환에서 빨강(0°) → 주황(30°) → 노랑(60°) → 초록(120°) → 파랑(240°) → 보라(300°)
+    hue = (np.arange(max(0, steps)) / steps) * 300 / 360  # 0~300도를 0~1 범위로 변환
+    
+    # 채도/명도 최대(S = V = 1)인 HSV를 RGB로 변환 (colorsys.hsv_to_rgb 와 같은 연산 순서)
+    sextant = (hue * 6.0).astype(np.int64)
+    f = (hue * 6.0) - sextant
+    levels = np.stack([np.ones_like(hue), 1.0 - f, 1.0 - (1.0 - f), np.zeros_like(hue)])  # v, q, t, p
+    rgb = levels[_HSV_SEXTANT_LEVELS[sextant % 6], np.arange(len(hue))[:, None]]
     
-    return colors
+    # 0-1 범위를 0-255 범위로 변환 (np.rint 는 round() 와 같은 round-half-even)
+    colors = np.rint(rgb * 255).astype(np.int64)
+    return tuple(map(tuple, colors.tolist()))
 
 
 def create_rainbow_frames(
@@ -119,7 +200,7 @@ def create_rainbow_frames(
     fps: int = 5,
     off_seconds: float = 1.0,
     steps: int = 60
-) -> List[List[List[List[int]]]]:
+) -> np.ndarray:
     """
     Create rainbow color animation frames with off periods.
     
@@ -132,39 +213,26 @@ def create_rainbow_frames(
         steps: Number of rainbow color steps (more = smoother transition)
         
     Returns:
-        List of frames for rainbow animation
+        uint8 array of shape (frames, height, width, 3) for rainbow animation
     """
-    frames = []
     rainbow_colors = create_rainbow_colors(steps)
     
-    total_frames = int(total_duration * fps)
+    total_frames = max(0, int(total_duration * fps))
     off_frames = int(off_seconds * fps)
     
-    # 무지개 색상당 할당할 프레임 수 계산
-    color_cycle_frames = max(1, steps + off_frames)  # 각 색상 + 꺼짐 시간
-    
-    frame_index = 0
-    while frame_index < total_frames:
-        # 모든 무지개 색상을 순회
-        for i, (r, g, b) in enumerate(rainbow_colors):
-            if frame_index >= total_frames:
-                break
-                
-            # 해당 색상 프레임 추가
-            color_frame = create_color_frame(r, g, b, width, height)
-            frames.append(color_frame)
-            frame_index += 1
-            
-            # 주기적으로 꺼짐 상태 추가 (예: 매 10번째 색상마다)
-            if (i + 1) % 10 == 0 and off_frames > 0:
-                for _ in range(min(off_frames, total_frames - frame_index)):
-                    if frame_index >= total_frames:
-                        break
-                    off_frame = create_color_frame(0, 0, 0, width, height)
-                    frames.append(off_frame)
-                    frame_index += 1
+    # 무지개 한 바퀴의 색상 순서 (-1 은 꺼짐): 매 10번째 색상 뒤에 꺼짐 상태 추가
+    color_sequence = []
+    for i in range(len(rainbow_colors)):
+        color_sequence.append(i)
+        if (i + 1) % 10 == 0 and off_frames > 0:
+            color_sequence.extend([-1] * off_frames)
+    if not color_sequence:
+        return np.zeros((0, height, width, 3), dtype=np.uint8)
     
-    return frames[:total_frames]  # 정확한 길이로 자르기
+    # 한 바퀴를 정확한 길이까지 반복하고, 마지막 행(검정)으로 꺼짐 표현
+    color_indices = np.resize(np.array(color_sequence), total_frames)
+    palette = np.array(rainbow_colors + ((0, 0, 0),), dtype=np.uint8)
+    return paint_frames(palette[color_indices], np.full(total_frames, -1), width, height)
 
 
 def apply_luminance(r: int, g: int, b: int, luminance: float) -> Tuple[int, int, int]:
@@ -192,7 +260,7 @@ def create_sequential_pixel_frames(
     luminance: float = 1.0,
     steps: int = 60,
     cycles: int = 10
-) -> List[List[List[List[int]]]]:
+) -> np.ndarray:
     """
     Create frames where pixels are turned on sequentially with rainbow colors.
     Only one pixel is lit at a time. Each cycle uses the same color, 
@@ -207,38 +275,28 @@ def create_sequential_pixel_frames(
         cycles: Number of cycles to repeat (default: 10)
         
     Returns:
-        List of frames for sequential pixel animation
+        uint8 array of shape (frames, height, width, 3) for sequential pixel animation
     """
-    frames = []
     # 고정된 7가지 무지개 색상 사용
     rainbow_colors = create_rainbow_colors(7)
     
+    # Luminance 적용 (7가지 색상에 대해 한 번만 계산)
+    cycle_colors = [apply_luminance(r, g, b, luminance) for r, g, b in rainbow_colors]
+    
     total_pixels = width * height
     
-    # 각 사이클에 대해 처리
-    for cycle in range(cycles):
-        # 현재 사이클의 색상 선택 (7가지 색상을 순환)
-        color_index = cycle % 7
-        r, g, b = rainbow_colors[color_index]
-        
-        # Luminance 적용
-        r, g, b = apply_luminance(r, g, b, luminance)
-        
-        # 현재 사이클에서 모든 픽셀을 순차적으로 켜기
-        for pixel_index in range(total_pixels):
-            # 픽셀 좌표 계산 (행 우선 순서)
-            row = pixel_index // width
-            col = pixel_index % width
-            
-            # 각 픽셀에 대해 frames_per_pixel 만큼 프레임 생성
-            for _ in range(frames_per_pixel):
-                # 모든 픽셀을 꺼진 상태로 초기화
-                frame = [[[0, 0, 0] for _ in range(width)] for _ in range(height)]
-                
-                # 현재 픽셀만 켜기
-                frame[row][col] = [r, g, b]
-                
-                frames.append(frame)
+    frames_per_cycle = total_pixels * frames_per_pixel
+    total_frames = max(0, cycles * frames_per_cycle)
+    
+    # 프레임 번호마다 사이클과 켜질 픽셀 계산 (행 우선 순서, 픽셀당 frames_per_pixel 프레임)
+    frame_indices = np.arange(total_frames)
+    cycle_ids = frame_indices // max(1, frames_per_cycle)
+    pixel_indices = (frame_indices // max(1, frames_per_pixel)) % max(1, total_pixels)
+    
+    # 전체를 꺼진 상태로 한 번에 할당하고, 각 프레임의 현재 픽셀만 사이클 색상으로 켜기
+    frames = np.zeros((total_frames, height, width, 3), dtype=np.uint8)
+    color_table = np.array(cycle_colors, dtype=np.uint8)
+    frames[frame_indices, pixel_indices // width, pixel_indices % width] = color_table[cycle_ids % 7]
     
     return frames
 
@@ -252,7 +310,7 @@ def create_sequential_fill_frames(
     fill_seconds: float = 2.0,
     off_seconds: float = 2.0,
     fps: int = 5
-) -> List[List[List[List[int]]]]:
+) -> np.ndarray:
     """
     Create frames where pixels scan sequentially, then fill entire board for fill_seconds,
     then turn off for off_seconds. Cycles through 7 rainbow colors.
@@ -268,49 +326,32 @@ def create_sequential_fill_frames(
         fps: Frames per second for timing calculations (default: 5)
         
     Returns:
-        List of frames for sequential-fill animation
+        uint8 array of shape (frames, height, width, 3) for sequential-fill animation
     """
-    frames = []
     # 고정된 7가지 무지개 색상 사용
     rainbow_colors = create_rainbow_colors(7)
     
+    # Luminance 적용 (7가지 색상에 대해 한 번만 계산)
+    cycle_colors = [apply_luminance(r, g, b, luminance) for r, g, b in rainbow_colors]
+    
     total_pixels = width * height
-    fill_frames = int(fill_seconds * fps)
-    off_frames = int(off_seconds * fps)
+    fill_frames = max(0, int(fill_seconds * fps))
+    off_frames = max(0, int(off_seconds * fps))
     
-    # 각 사이클에 대해 처리
-    for cycle in range(cycles):
-        # 현재 사이클의 색상 선택 (7가지 색상을 순환)
-        color_index = cycle % 7
-        r, g, b = rainbow_colors[color_index]
-        
-        # Luminance 적용
-        r, g, b = apply_luminance(r, g, b, luminance)
-        
-        # 1. 픽셀 단위로 순차적 스캔
-        for pixel_index in range(total_pixels):
-            # 픽셀 좌표 계산 (행 우선 순서)
-            row = pixel_index // width
-            col = pixel_index % width
-            
-            # 각 픽셀에 대해 frames_per_pixel 만큼 프레임 생성
-            for _ in range(frames_per_pixel):
-                # 모든 픽셀을 꺼진 상태로 초기화
-                frame = [[[0, 0, 0] for _ in range(width)] for _ in range(height)]
-                
-                # 현재 픽셀만 켜기
-                frame[row][col] = [r, g, b]
-                
-                frames.append(frame)
-        
-        # 2. 전체 보드를 해당 색상으로 fill_seconds 동안 켜기
-        fill_frame = create_color_frame(r, g, b, width, height)
-        for _ in range(fill_frames):
-            frames.append(fill_frame)
-        
-        # 3. 전체 보드를 off_seconds 동안 끄기
-        off_frame = create_color_frame(0, 0, 0, width, height)
-        for _ in range(off_frames):
-            frames.append(off_frame)
+    # 사이클 구성: 1. 픽셀 단위 순차 스캔 → 2. 전체 보드 켜기 → 3. 전체 보드 끄기
+    scan_frames = total_pixels * frames_per_pixel
+    cycle_frames = scan_frames + fill_frames + off_frames
+    total_frames = max(0, cycles * cycle_frames)
     
-    return frames
+    # 프레임 번호마다 사이클, 사이클 내 위치, 켜질 픽셀(스캔 구간만) 계산
+    frame_indices = np.arange(total_frames)
+    cycle_ids = frame_indices // max(1, cycle_frames)
+    positions = frame_indices % max(1, cycle_frames)
+    lit_pixels = np.where(positions < scan_frames, positions // max(1, frames_per_pixel), -1)
+    
+    # 스캔/켜기 구간은 사이클 색상 (7가지 색상을 순환), 끄기 구간은 검정
+    color_table = np.array(cycle_colors, dtype=np.uint8)
+    frame_colors = color_table[cycle_ids % 7]
+    frame_colors[positions >= scan_frames + fill_frames] = 0
+    
+    return paint_frames(frame_colors, lit_pixels, width, height)
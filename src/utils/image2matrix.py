@@ -2,27 +2,22 @@
 
 from typing import List, Dict, Union, Literal, Any
 from PIL import Image
+import numpy as np
 
-def image_to_matrix(image: Image.Image) -> List[List[List[int]]]:
+def image_to_matrix(image: Image.Image) -> np.ndarray:
 
     """
     Convert a PIL Image to a matrix representation.
     Args:
         image (Image.Image): The input image to convert.
     Returns:
-        List[List[List[int]]]: A matrix where each element is a list of RGB values.
+        np.ndarray: A (height, width, 3) uint8 array of RGB values.
     """
 
-    width, height = image.size
-    matrix: List[List[List[int]]] = []
-    for y in range(height):
-        row: List[List[int]] = []
-        for x in range(width):
-            r, g, b = image.getpixel((x, y))[:3]  # Get RGB values
-            row.append([r, g, b])  # Append RGB values as a list
-        matrix.append(row)  # Append the row to the matrix
-    
-    return matrix
+    # Already-RGB images (common for PNG pixelart) skip the converted copy
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    return np.asarray(image, dtype=np.uint8)
 
 if __name__ == "__main__":
     img_path = r"C:\Users\URANUS\Desktop\baejeongwon\pixeltobin\pixelart-to-bin\data\watermelon\수박_1.png"
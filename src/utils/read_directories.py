@@ -1,4 +1,4 @@
-from os import *
+import os
 
 def read_filenames_in_directory(directory: str) -> list:
     """
@@ -10,10 +10,12 @@ def read_filenames_in_directory(directory: str) -> list:
     Returns:
         list: A list of file paths in the directory.
     """
-    if not path.isdir(directory):
+    if not os.path.isdir(directory):
         raise ValueError(f"The provided path '{directory}' is not a valid directory.")
     
-    files = [path.join(directory, f) for f in listdir(directory) if path.isfile(path.join(directory, f))]
+    # scandir entries carry their file type, so no extra stat per entry
+    with os.scandir(directory) as it:
+        files = [entry.path for entry in it if entry.is_file()]
     return files
 
 def read_directories_in_directory(directory: str) -> list:
@@ -26,10 +28,11 @@ def read_directories_in_directory(directory: str) -> list:
     Returns:
         list: A list of directory paths in the directory.
     """
-    if not path.isdir(directory):
+    if not os.path.isdir(directory):
         raise ValueError(f"The provided path '{directory}' is not a valid directory.")
     
-    directories = [path.join(directory, d) for d in listdir(directory) if path.isdir(path.join(directory, d))]
+    with os.scandir(directory) as it:
+        directories = [entry.path for entry in it if entry.is_dir()]
     return directories
 
 if __name__ == "__main__":
@@ -0,0 +1,35 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.utils.add_metadata import add_metadata, encode_frame
+
+
+class AddMetadataTest(unittest.TestCase):
+
+    def test_list_and_ndarray_payloads_match(self):
+        frames = [np.full((2, 3, 3), i, dtype=np.uint8) for i in range(12)]
+        sequence = [frames[i % 12] for i in range(30)] + [frames[0]] * 5 + [frames[1], frames[0]] * 4
+        expected = add_metadata(np.stack(sequence))
+        # Trailer save time may differ by a second
+        self.assertEqual(add_metadata(sequence)[:-12], expected[:-12])
+        self.assertEqual(add_metadata([f.tolist() for f in sequence])[:-12], expected[:-12])
+
+    def test_out_of_range_values_are_rejected(self):
+        for values in ([[[300, 0, 0]]], [[[-1, 0, 0]]], [[[1.7, 0, 0]]]):
+            with self.subTest(values=values):
+                with self.assertRaises(ValueError):
+                    encode_frame(values)
+                with self.assertRaises(ValueError):
+                    add_metadata(np.array([values]))
+
+    def test_integer_arrays_in_range_are_cast(self):
+        frame = np.array([[[255, 0, 1]]], dtype=np.int64)
+        self.assertEqual(encode_frame(frame), b'\xff\x00\x01')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.utils.bin_maker import bin_maker, BinWriter
+from src.utils.add_metadata import add_metadata
+
+
+def read_file(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+class BinMakerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.output_path = os.path.join(self.tmp.name, 'out.bin')
+
+    def test_failed_encode_removes_partial_file(self):
+        frames = [[[[1, 2, 3]]]] * 3 + [[[[300, 0, 0]]]]
+        with self.assertRaises(ValueError):
+            bin_maker(frames, self.output_path)
+        self.assertFalse(os.path.exists(self.output_path))
+
+
+class BinWriterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.output_path = os.path.join(self.tmp.name, 'out.bin')
+        rng = np.random.default_rng(0)
+        self.frames = rng.integers(0, 256, size=(7, 3, 4, 3), dtype=np.uint8)
+
+    def write(self, *blocks):
+        with redirect_stdout(StringIO()), BinWriter(self.output_path, fps=5) as writer:
+            for block in blocks:
+                if block.ndim == 3:
+                    writer.write_frame(block)
+                else:
+                    writer.write_frames(block)
+        return writer
+
+    def test_matches_in_memory_encoding(self):
+        writer = self.write(self.frames[0], self.frames[1:4], self.frames[4:4], self.frames[4:])
+        self.assertEqual(writer.frame_count, len(self.frames))
+        # Trailer save time may differ by a second
+        self.assertEqual(read_file(self.output_path)[:-12], add_metadata(self.frames, fps=5)[:-12])
+        self.assertEqual(read_file(self.output_path)[-4:], (0xDEADBEEF).to_bytes(4, 'little'))
+
+    def test_header_frame_count_is_patched(self):
+        self.write(self.frames[:2], self.frames[2:])
+        total_frames, height, width, fps = np.frombuffer(read_file(self.output_path)[:16], dtype='<u4')
+        self.assertEqual((total_frames, height, width, fps), (7, 3, 4, 5))
+
+    def test_failed_block_removes_partial_file(self):
+        with self.assertRaises(ValueError):
+            self.write(self.frames[:3], np.zeros((2, 4, 4, 3), dtype=np.uint8))
+        self.assertFalse(os.path.exists(self.output_path))
+
+    def test_close_without_frames_raises(self):
+        with self.assertRaises(ValueError):
+            self.write()
+        self.assertFalse(os.path.exists(self.output_path))
+
+    def test_matches_bin_maker(self):
+        self.write(self.frames)
+        streamed = read_file(self.output_path)
+        with redirect_stdout(StringIO()):
+            bin_maker(list(self.frames), self.output_path, fps=5)
+        self.assertEqual(streamed[:-12], read_file(self.output_path)[:-12])
+
+
+if __name__ == '__main__':
+    unittest.main()
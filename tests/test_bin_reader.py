@@ -0,0 +1,70 @@
+import os
+import struct
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.test.test_bin import (find_black_frames, frame_view, map_bin_file, read_bin_header, read_bin_trailer,
+                               unpack_bin_header, unpack_bin_trailer)
+from src.utils.add_metadata import add_metadata
+
+
+class BinReaderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        rng = np.random.default_rng(0)
+        self.frames = rng.integers(1, 256, size=(6, 3, 4, 3), dtype=np.uint8)
+        self.frames[[1, 4]] = 0
+        self.data = add_metadata(self.frames, fps=5)
+        self.path = self.write('good.bin', self.data)
+        self.frame_data_size = self.frames[0].size * len(self.frames)
+
+    def write(self, name, data):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def test_header_and_trailer_match_struct_unpack(self):
+        expected_header = struct.unpack('<IIII', self.data[:16])
+        expected_trailer = struct.unpack('<IQI', self.data[16 + self.frame_data_size:])
+        self.assertEqual(expected_header, (6, 3, 4, 5))
+        self.assertEqual(read_bin_header(self.path), expected_header)
+        self.assertEqual(read_bin_trailer(self.path, self.frame_data_size), expected_trailer)
+
+        mm = map_bin_file(self.path)
+        self.addCleanup(mm.close)
+        self.assertEqual(unpack_bin_header(mm), expected_header)
+        self.assertEqual(unpack_bin_trailer(mm, self.frame_data_size), expected_trailer)
+        self.assertEqual(expected_trailer[2], 0xDEADBEEF)
+
+    def test_frame_views_match_frames(self):
+        mm = map_bin_file(self.path)
+        self.addCleanup(mm.close)
+        for index, frame in enumerate(self.frames):
+            view = frame_view(mm, index, 3, 4)
+            np.testing.assert_array_equal(view, frame)
+            del view  # release the export so the mapping can close
+        with self.assertRaises(ValueError):
+            frame_view(mm, len(self.frames), 3, 4)
+
+    def test_truncated_file_raises(self):
+        truncated = self.write('trunc.bin', self.data[:16 + self.frame_data_size + 8])
+        with self.assertRaises(ValueError):
+            read_bin_trailer(truncated, self.frame_data_size)
+        with self.assertRaises(ValueError):
+            read_bin_header(self.write('short.bin', self.data[:10]))
+        with self.assertRaises(ValueError):
+            frame_view(self.data[:16 + self.frames[0].size * 2], 2, 3, 4)
+
+    def test_black_frames(self):
+        np.testing.assert_array_equal(find_black_frames(self.frames), [False, True, False, False, True, False])
+
+
+if __name__ == '__main__':
+    unittest.main()
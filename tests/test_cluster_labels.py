@@ -0,0 +1,73 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.cluster.cluster_expression import draw_set_label
+
+# Fonts tried when PIXELART_TEST_FONT is not set (Pillow also searches the system font dirs)
+FONT_CANDIDATES = ['arial.ttf', 'DejaVuSans.ttf', 'LiberationSans-Regular.ttf', 'FreeSans.ttf']
+
+
+def load_truetype_font(size: int):
+    """Load a real TrueType font, or return None when none is available."""
+    candidates = [os.environ['PIXELART_TEST_FONT']] if os.environ.get('PIXELART_TEST_FONT') else FONT_CANDIDATES
+    for name in candidates:
+        try:
+            return ImageFont.truetype(name, size=size)
+        except OSError:
+            continue
+    return None
+
+
+def draw_set_label_in_place(image, set_text, center_x, center_y, font):
+    """Reference: the original per-label ImageDraw code path."""
+    draw = ImageDraw.Draw(image)
+    text_bbox = draw.textbbox((center_x, center_y), set_text, font=font)
+    text_w = text_bbox[2] - text_bbox[0]
+    text_h = text_bbox[3] - text_bbox[1]
+    text_x = center_x - text_w // 2
+    text_y = center_y - text_h // 2
+    draw.rectangle([text_x - 2, text_y - 2, text_x + text_w + 2, text_y + text_h + 2],
+                   fill='white', outline='black')
+    draw.text((text_x, text_y), set_text, fill='red', font=font)
+
+
+class DrawSetLabelTest(unittest.TestCase):
+
+    def assert_matches_in_place(self, font):
+        rng = np.random.default_rng(0)
+        background = Image.fromarray(rng.integers(0, 256, (300, 400, 3), dtype=np.uint8))
+        labels = [('0', 40, 40), ('7', 120, 60), ('12', 200, 150), ('135', 300, 240), ('12', 90, 220)]
+
+        expected = background.copy()
+        for set_text, x, y in labels:
+            draw_set_label_in_place(expected, set_text, x, y, font)
+
+        actual = background.copy()
+        draw = ImageDraw.Draw(actual)
+        glyphs = {}
+        for set_text, x, y in labels:
+            draw_set_label(actual, draw, set_text, x, y, font, glyphs)
+
+        diff = np.any(np.asarray(expected) != np.asarray(actual), axis=2)
+        self.assertEqual(int(diff.sum()), 0)
+
+    def test_truetype_font_matches_in_place_drawing(self):
+        for size in (12, 25, 60):
+            font = load_truetype_font(size)
+            if font is None:
+                self.skipTest('no TrueType font found; set PIXELART_TEST_FONT to a .ttf path')
+            with self.subTest(size=size):
+                self.assertGreater(font.getbbox('0')[1], 0)  # the case that used to clip
+                self.assert_matches_in_place(font)
+
+    def test_default_font_matches_in_place_drawing(self):
+        self.assert_matches_in_place(ImageFont.load_default())
+
+
+if __name__ == '__main__':
+    unittest.main()
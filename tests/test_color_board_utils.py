@@ -0,0 +1,65 @@
+import colorsys
+import os
+import sys
+import unittest
+from unittest import mock
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.utils import color_board_utils
+
+
+def reference_paint(frame_colors, lit_pixels, width, height):
+    """Per-frame loop over the documented semantics."""
+    out = np.zeros((len(frame_colors), height, width, 3), dtype=np.uint8)
+    for k, (color, pixel) in enumerate(zip(frame_colors, lit_pixels)):
+        if pixel >= 0:
+            out[k, pixel // width, pixel % width] = color
+        else:
+            out[k] = color
+    return out
+
+
+def reference_rainbow(steps):
+    """The original colorsys-based rainbow table."""
+    colors = []
+    for i in range(steps):
+        rgb = colorsys.hsv_to_rgb((i / steps) * 300 / 360, 1.0, 1.0)
+        colors.append(tuple(int(round(c * 255)) for c in rgb))
+    return colors
+
+
+class PaintFramesTest(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.width, self.height = 5, 3
+        self.frame_colors = rng.integers(0, 256, size=(40, 3), dtype=np.uint8)
+        self.frame_colors[::7] = 0  # black frames stay off
+        self.lit_pixels = rng.integers(-1, self.width * self.height, size=40)
+        self.lit_pixels[::3] = -1
+
+    def paint(self):
+        return color_board_utils.paint_frames(self.frame_colors, self.lit_pixels, self.width, self.height)
+
+    def test_matches_reference(self):
+        expected = reference_paint(self.frame_colors, self.lit_pixels, self.width, self.height)
+        np.testing.assert_array_equal(self.paint(), expected)
+
+    def test_numpy_fallback_matches_kernel(self):
+        with mock.patch.object(color_board_utils, 'njit', None):
+            fallback = self.paint()
+        np.testing.assert_array_equal(fallback, self.paint())
+
+
+class RainbowColorsTest(unittest.TestCase):
+
+    def test_matches_colorsys(self):
+        for steps in range(3000):
+            self.assertEqual(list(color_board_utils.create_rainbow_colors(steps)), reference_rainbow(steps),
+                             f'steps={steps}')
+
+
+if __name__ == '__main__':
+    unittest.main()
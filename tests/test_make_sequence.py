@@ -0,0 +1,101 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.generate.make_sequence import COUNTDOWN_COLORS, assemble_loop, create_sequence_from_config
+from src.utils.add_metadata import add_metadata
+
+FPS = 5
+
+
+def reference_frames(images, loop_count, loop_delay_ms, countdown_enabled):
+    """Frame list built the way the original list-based implementation did."""
+    height, width = images[0].shape[:2]
+    countdown = [np.full((height, width, 3), color, dtype=np.uint8)
+                 for color in COUNTDOWN_COLORS for _ in range(FPS)] if countdown_enabled else []
+    black = np.zeros((height, width, 3), dtype=np.uint8)
+    delay_frames = int((loop_delay_ms / 1000) / 0.2) if loop_delay_ms > 0 else 0
+
+    frames = []
+    if loop_count == -1:
+        frames_per_loop = len(countdown) + len(images) + delay_frames
+        loops = int(3600 / (frames_per_loop * 0.2))
+        for loop_idx in range(loops):
+            frames.extend(countdown)
+            frames.extend(images)
+            if loop_idx < loops - 1:
+                frames.extend([black] * delay_frames)
+        remaining_time = 3600 - len(frames) * 0.2
+        if remaining_time > 0:
+            frames.extend(images[t % len(images)] for t in range(int(remaining_time / 0.2)))
+    else:
+        for _ in range(loop_count):
+            frames.extend(countdown)
+            frames.extend(images)
+            frames.extend([black] * delay_frames)
+    return frames
+
+
+class AssembleLoopTest(unittest.TestCase):
+
+    def test_countdown_images_then_delay(self):
+        images = np.arange(2 * 3 * 4 * 3, dtype=np.uint8).reshape(2, 3, 4, 3)
+        colors = np.array(COUNTDOWN_COLORS, dtype=np.uint8)
+        loop = assemble_loop(images, colors, FPS, 5)
+        expected = np.stack(reference_frames(list(images), 1, 1000, True))
+        np.testing.assert_array_equal(loop, expected)
+
+    def test_without_countdown(self):
+        images = np.ones((2, 3, 4, 3), dtype=np.uint8)
+        loop = assemble_loop(images, np.zeros((0, 3), dtype=np.uint8), FPS, 0)
+        np.testing.assert_array_equal(loop, images)
+
+
+class CreateSequenceFromConfigTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        rng = np.random.default_rng(0)
+        self.images = [rng.integers(0, 256, size=(3, 4, 3), dtype=np.uint8) for _ in range(3)]
+        for i, image in enumerate(self.images):
+            Image.fromarray(image).save(os.path.join(self.tmp.name, f'frame_{i + 1}.png'))
+        self.output_path = os.path.join(self.tmp.name, 'out.bin')
+
+    def check(self, config):
+        with open(os.path.join(self.tmp.name, 'config.json'), 'w') as f:
+            json.dump(config, f)
+        with redirect_stdout(StringIO()):
+            create_sequence_from_config(self.tmp.name, self.output_path)
+        expected = add_metadata(reference_frames(self.images, config['loop'], config['loopDelay'],
+                                                 config['countDown']), FPS)
+        with open(self.output_path, 'rb') as f:
+            data = f.read()
+        # Trailer save time may differ by a second
+        self.assertEqual(len(data), len(expected))
+        self.assertEqual(data[:-12], expected[:-12])
+        self.assertEqual(data[-4:], expected[-4:])
+
+    def test_finite_loops(self):
+        self.check({'loop': 3, 'loopDelay': 1000, 'countDown': True})
+
+    def test_finite_loops_without_countdown_or_delay(self):
+        self.check({'loop': 2, 'loopDelay': 0, 'countDown': False})
+
+    def test_infinite_loop_fills_one_hour(self):
+        self.check({'loop': -1, 'loopDelay': 1400, 'countDown': True})
+
+    def test_infinite_loop_without_delay(self):
+        self.check({'loop': -1, 'loopDelay': 0, 'countDown': False})
+
+
+if __name__ == '__main__':
+    unittest.main()
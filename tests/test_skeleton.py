@@ -0,0 +1,136 @@
+import json
+import os
+import struct
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import skeleton
+
+PALETTE = np.array([[0, 0, 0], [255, 0, 0], [0, 255, 0], [0, 0, 255]], dtype=np.uint8)
+
+
+def parse_stack_header(chunks):
+    """Return (kind, bits, shape, payload size) of a single-stack array_to_bin_data result."""
+    prefix, payload = chunks
+    size, kind, dtype_len = struct.unpack_from('<IBB', prefix, 0)
+    offset = 6 + dtype_len
+    bits, ndim = struct.unpack_from('<BB', prefix, offset)
+    shape = struct.unpack_from(f'<{ndim}Q', prefix, offset + 2)
+    return kind, bits, shape, len(payload)
+
+
+class PaletteIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        rng = np.random.default_rng(0)
+        self.indices = rng.integers(0, len(PALETTE), size=(3, 5, 7), dtype=np.uint8)
+        self.paths = []
+        for i, frame in enumerate(self.indices):
+            path = os.path.join(self.tmp.name, f'img_{i + 1}.png')
+            Image.fromarray(PALETTE[frame]).save(path)
+            self.paths.append(path)
+        self.bin_path = os.path.join(self.tmp.name, 'out.bin')
+
+    def test_load_with_palette_returns_indices(self):
+        arrays = skeleton.load_images_and_convert(self.paths, self.bin_path, PALETTE, disk_cache=False)
+        self.assertEqual(arrays.dtype, np.uint8)
+        np.testing.assert_array_equal(arrays, self.indices)
+
+    def test_palette_indices_are_nibble_packed(self):
+        arrays = skeleton.load_images_and_convert(self.paths, self.bin_path, PALETTE, disk_cache=False)
+        kind, bits, shape, payload_size = parse_stack_header(skeleton.array_to_bin_data(arrays))
+        self.assertEqual(kind, skeleton.ARRAY_KIND_STACK)
+        self.assertEqual(bits, 4)
+        self.assertEqual(shape, self.indices.shape)
+        self.assertEqual(payload_size, (self.indices.size + 1) // 2)
+
+    def test_dark_rgb_is_not_packed(self):
+        dark = np.full((2, 4, 4, 3), 7, dtype=np.uint8)
+        kind, bits, shape, payload_size = parse_stack_header(skeleton.array_to_bin_data(dark))
+        self.assertEqual(bits, 8)
+        self.assertEqual(payload_size, dark.size)
+
+    def test_config_palette_reaches_bin(self):
+        folder = os.path.join(self.tmp.name, 'S#1')
+        os.mkdir(folder)
+        for path in self.paths:
+            os.replace(path, os.path.join(folder, os.path.basename(path)))
+        with open(os.path.join(folder, 'config.json'), 'w') as f:
+            json.dump({'cluster': {'1': [0, 1, 2]}, 'palette': PALETTE.tolist()}, f)
+        with mock.patch.dict(os.environ, {'PIXELART_TO_BIN_NO_CACHE': '1'}):
+            bin_path = skeleton.generate_bin_file(folder, 'pixelart', force=True)
+        with open(bin_path, 'rb') as f:
+            data = f.read()
+        self.assertIn(skeleton.pack_nibbles(self.indices).tobytes(), data)
+
+
+class EncodeMetadataTest(unittest.TestCase):
+
+    METADATA = {'cluster': {1: [0, 1], 2: [2, 3]}, 'title': '픽셀 아트', 'action': ['left', 'stay']}
+
+    def encode_stdlib(self, metadata):
+        with mock.patch.object(skeleton, 'orjson', None):
+            return skeleton.encode_metadata(metadata)
+
+    def test_stdlib_writes_compact_utf8(self):
+        encoded = self.encode_stdlib(self.METADATA)
+        self.assertEqual(encoded, '{"cluster":{"1":[0,1],"2":[2,3]},"title":"픽셀 아트","action":["left","stay"]}'.encode('utf-8'))
+
+    def test_stdlib_rejects_nan(self):
+        with self.assertRaises(ValueError):
+            self.encode_stdlib({'loop': float('nan')})
+
+    @unittest.skipIf(skeleton.orjson is None, 'orjson is not installed')
+    def test_orjson_matches_stdlib(self):
+        self.assertEqual(skeleton.encode_metadata(self.METADATA), self.encode_stdlib(self.METADATA))
+
+
+class UpToDateTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.folder = os.path.join(self.tmp.name, 'S#1')
+        os.mkdir(self.folder)
+        self.image_path = os.path.join(self.folder, 'img_1.png')
+        Image.new('RGB', (2, 2)).save(self.image_path)
+        self.bin_path = os.path.join(self.folder, 'S#1.bin')
+        with open(self.bin_path, 'wb') as f:
+            f.write(b'bin')
+
+    def set_mtimes(self, image, bin_file, folder):
+        os.utime(self.image_path, ns=(image, image))
+        os.utime(self.bin_path, ns=(bin_file, bin_file))
+        os.utime(self.folder, ns=(folder, folder))
+
+    def is_up_to_date(self):
+        _, _, source_mtime = skeleton.get_file_paths(self.folder, include_dir_mtime=False)
+        return skeleton._is_up_to_date(self.bin_path, source_mtime, os.stat(self.folder).st_mtime_ns)
+
+    def test_newer_bin_is_up_to_date(self):
+        self.set_mtimes(image=1_000, bin_file=2_000, folder=2_000)
+        self.assertTrue(self.is_up_to_date())
+
+    def test_image_in_same_tick_is_rebuilt(self):
+        self.set_mtimes(image=2_000, bin_file=2_000, folder=1_000)
+        self.assertFalse(self.is_up_to_date())
+
+    def test_folder_changed_after_bin_is_rebuilt(self):
+        self.set_mtimes(image=1_000, bin_file=2_000, folder=3_000)
+        self.assertFalse(self.is_up_to_date())
+
+    def test_missing_bin_is_rebuilt(self):
+        os.remove(self.bin_path)
+        self.assertFalse(skeleton._is_up_to_date(self.bin_path, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()